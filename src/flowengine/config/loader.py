@@ -4,6 +4,7 @@ This module provides the ConfigLoader class for loading and
 validating flow configurations from YAML files or strings.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Union
 
@@ -13,6 +14,13 @@ from pydantic import ValidationError
 from flowengine.config.schema import FlowConfig
 from flowengine.errors import ConfigurationError
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml fall back
+# to the pure-Python SafeLoader (same safety guarantees, same errors).
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class ConfigLoader:
     """Loads and validates flow configurations.
@@ -21,6 +29,7 @@ class ConfigLoader:
     - YAML files
     - YAML strings
     - Python dictionaries
+    - JSON strings/bytes
 
     Example:
         ```python
@@ -83,15 +92,7 @@ class ConfigLoader:
                 config_path=str(path),
             ) from e
 
-        try:
-            data = yaml.safe_load(content)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(
-                f"Invalid YAML: {e}",
-                config_path=str(path),
-            ) from e
-
-        return ConfigLoader._validate(data, str(path))
+        return _parse_yaml(content, str(path)).model_copy(deep=True)
 
     @staticmethod
     def loads(yaml_string: str) -> FlowConfig:
@@ -106,12 +107,7 @@ class ConfigLoader:
         Raises:
             ConfigurationError: If YAML is invalid or validation fails
         """
-        try:
-            data = yaml.safe_load(yaml_string)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Invalid YAML: {e}") from e
-
-        return ConfigLoader._validate(data)
+        return _parse_yaml(yaml_string).model_copy(deep=True)
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> FlowConfig:
@@ -128,6 +124,42 @@ class ConfigLoader:
         """
         return ConfigLoader._validate(data)
 
+    @staticmethod
+    def from_json(data: str | bytes) -> FlowConfig:
+        """Load configuration from a JSON document.
+
+        Parsed and validated in one pass by pydantic's JSON parser, without
+        building an intermediate Python dictionary.
+
+        Args:
+            data: JSON content as string or bytes
+
+        Returns:
+            Validated FlowConfig object
+
+        Raises:
+            ConfigurationError: If JSON is invalid or validation fails
+        """
+        try:
+            return FlowConfig.model_validate_json(data)
+        except ValidationError as e:
+            for err in e.errors(include_url=False):
+                if err["type"] == "json_invalid":
+                    # pydantic's message already reads "Invalid JSON: ..."
+                    raise ConfigurationError(err["msg"]) from e
+                if err["type"] == "model_type" and not err["loc"]:
+                    # Top-level null or non-object: report it as _validate does
+                    if err["input"] is None:
+                        raise ConfigurationError("Configuration is empty") from e
+                    raise ConfigurationError(
+                        "Configuration must be a dictionary, "
+                        f"got {type(err['input']).__name__}"
+                    ) from e
+            raise ConfigurationError(
+                "Configuration validation failed",
+                details=ConfigLoader._format_errors(e),
+            ) from e
+
     @staticmethod
     def _validate(
         data: Any,
@@ -160,15 +192,53 @@ class ConfigLoader:
         try:
             return FlowConfig.model_validate(data)
         except ValidationError as e:
-            # Extract error messages
-            errors = []
-            for error in e.errors():
-                loc = ".".join(str(x) for x in error["loc"])
-                msg = error["msg"]
-                errors.append(f"{loc}: {msg}")
-
             raise ConfigurationError(
                 "Configuration validation failed",
                 config_path=config_path,
-                details=errors,
+                details=ConfigLoader._format_errors(e),
             ) from e
+
+    @staticmethod
+    def _format_errors(error: ValidationError) -> list[str]:
+        """Format pydantic validation errors as ``loc: msg`` strings."""
+        # Only loc/msg are used, so skip the docs URL, context and echoed
+        # input pydantic would build
+        errors = []
+        for err in error.errors(
+            include_url=False, include_context=False, include_input=False
+        ):
+            loc = ".".join(str(x) for x in err["loc"])
+            errors.append(f"{loc}: {err['msg']}")
+        return errors
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(content: str, config_path: str | None = None) -> FlowConfig:
+    """Parse and validate YAML content, memoized by content and path.
+
+    Identical documents (repeated loads, hot reloads of an unchanged file)
+    are only parsed and validated once. The cached FlowConfig is shared:
+    callers must return a deep copy, which still costs a fraction of a
+    CSafeLoader parse plus validation. The cache is kept small since it
+    holds each document and its model for the life of the process.
+    Failures raise and are therefore never cached.
+
+    Args:
+        content: YAML document text
+        config_path: Optional path for error messages
+
+    Returns:
+        Validated FlowConfig object (shared, do not mutate)
+
+    Raises:
+        ConfigurationError: If YAML is invalid or validation fails
+    """
+    try:
+        data = yaml.load(content, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ConfigurationError(
+            f"Invalid YAML: {e}",
+            config_path=config_path,
+        ) from e
+
+    return ConfigLoader._validate(data, config_path)
@@ -7,6 +7,7 @@ and validating that component instances match their declared types.
 from __future__ import annotations
 
 import importlib
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 from flowengine.errors import ConfigurationError
@@ -15,9 +16,15 @@ if TYPE_CHECKING:
     from flowengine.core.component import BaseComponent
 
 
+@lru_cache(maxsize=256)
 def load_component_class(type_path: str) -> type[BaseComponent]:
     """Load a component class from its type path.
 
+    Successful resolutions are memoized per type path, so engines built
+    repeatedly from the same config skip the import/getattr/issubclass
+    walk. Failures raise and are not cached. Call
+    ``load_component_class.cache_clear()`` after reloading a module.
+
     Args:
         type_path: Fully qualified class path (e.g., "myapp.components.MyComponent")
 
@@ -5,6 +5,7 @@ Provides a component that makes HTTP requests using httpx.
 
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any
 
 from flowengine.core.component import BaseComponent
@@ -12,13 +13,9 @@ from flowengine.core.component import BaseComponent
 if TYPE_CHECKING:
     from flowengine.core.context import FlowContext
 
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
-    httpx = None  # type: ignore[assignment]
+# Only probe for httpx here; the (comparatively heavy) import is deferred
+# until a component actually creates a client in setup().
+HTTPX_AVAILABLE = find_spec("httpx") is not None
 
 
 class HTTPComponent(BaseComponent):
@@ -111,6 +108,8 @@ class HTTPComponent(BaseComponent):
         if not HTTPX_AVAILABLE:
             return
 
+        import httpx
+
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=self.timeout,
@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Checkpoint:
     """Serializable snapshot of a suspended flow execution."""
 
@@ -35,13 +35,34 @@ class DotDict:
         ```
     """
 
+    # Set via object.__setattr__ in __init__; declared so attribute access
+    # is typed rather than routed through __getattr__
+    _data: dict[str, Any]
+    _wrapped: dict[str, DotDict]
+
     def __init__(self, data: Optional[dict[str, Any]] = None) -> None:
         """Initialize DotDict with optional data.
 
         Args:
             data: Initial dictionary data (defaults to empty dict)
         """
-        object.__setattr__(self, "_data", data or {})
+        # Keep the caller's dict even when empty: nested wrappers must write
+        # through to the parent's storage
+        object.__setattr__(self, "_data", data if data is not None else {})
+        # Memoized wrappers for nested dicts, keyed by data key
+        object.__setattr__(self, "_wrapped", {})
+
+    def _wrap(self, key: str, value: dict[str, Any]) -> DotDict:
+        """Return a (memoized) DotDict view of the nested dict at ``key``.
+
+        The cached wrapper is reused only while it still wraps the very dict
+        stored under ``key``; a replaced value gets a fresh wrapper.
+        """
+        wrapper = self._wrapped.get(key)
+        if wrapper is None or wrapper._data is not value:
+            wrapper = DotDict(value)
+            self._wrapped[key] = wrapper
+        return wrapper
 
     def __getattr__(self, key: str) -> Any:
         """Get attribute with automatic DotDict wrapping for nested dicts.
@@ -59,7 +80,7 @@ class DotDict:
         if key in self._data:
             value = self._data[key]
             if isinstance(value, dict):
-                return DotDict(value)
+                return self._wrap(key, value)
             return value
 
         # Return None for missing keys
@@ -79,6 +100,8 @@ class DotDict:
                 self._data[key] = value._data
             else:
                 self._data[key] = value
+            # Drop the old wrapper so it does not keep a replaced dict alive
+            self._wrapped.pop(key, None)
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists in data.
@@ -101,6 +124,7 @@ class DotDict:
             object.__delattr__(self, key)
         elif key in self._data:
             del self._data[key]
+            self._wrapped.pop(key, None)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get value with default fallback.
@@ -112,11 +136,51 @@ class DotDict:
         Returns:
             Value at key or default
         """
-        value = getattr(self, key, None)
+        if key.startswith("_"):
+            value = getattr(self, key, None)
+        else:
+            # Read the data dict directly: avoids the getattr/__getattr__
+            # round-trip and never resolves to a DotDict method name
+            value = self._data.get(key)
+            if isinstance(value, dict):
+                return self._wrap(key, value)
         if value is None:
             return default
         return value
 
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get value, storing default first if key is missing.
+
+        Unlike ``get``, the returned object is the one held in the data,
+        so mutable values (lists, dicts) can be updated in place.
+
+        As with ``get``, a key stored as None counts as missing, and keys
+        starting with "_" are instance attributes rather than data.
+
+        Args:
+            key: Key to retrieve
+            default: Value to store if key not found
+
+        Returns:
+            Stored value, wrapped in DotDict if it's a dict
+        """
+        if key.startswith("_"):
+            value = getattr(self, key, None)
+            if value is None:
+                object.__setattr__(self, key, default)
+                value = default
+            return value
+
+        if isinstance(default, DotDict):
+            default = default._data
+        value = self._data.get(key)
+        if value is None:
+            self._data[key] = value = default
+            self._wrapped.pop(key, None)
+        if isinstance(value, dict):
+            return self._wrap(key, value)
+        return value
+
     def keys(self) -> list[str]:
         """Get all keys in the data.
 
@@ -148,6 +212,8 @@ class DotDict:
             data: Dictionary to merge
         """
         self._data.update(data)
+        for key in data:
+            self._wrapped.pop(key, None)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to regular dictionary.
@@ -168,7 +234,7 @@ class DotDict:
         return False
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class StepTiming:
     """Timing information for a single step execution.
 
@@ -187,7 +253,7 @@ class StepTiming:
     execution_order: int = 0  # Order of actual execution
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class ExecutionMetadata:
     """Metadata about flow execution.
 
@@ -363,7 +429,7 @@ class ExecutionMetadata:
         return (self.completed_at - self.started_at).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class FlowContext:
     """Context object passed through all components in a flow.
 
@@ -423,6 +489,47 @@ class FlowContext:
         """
         return self.data.get(key, default)
 
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get a value from the data container, storing default if missing.
+
+        Lets components append to accumulators without a get/set round-trip:
+        ``context.setdefault("log", []).append(entry)``.
+
+        Args:
+            key: Key to retrieve
+            default: Value to store if key not found
+
+        Returns:
+            Stored value
+        """
+        return self.data.setdefault(key, default)
+
+    def increment(self, key: str, amount: float = 1) -> float:
+        """Add to a numeric value in the data container.
+
+        Missing keys start from 0, so counters need no initialization:
+        ``context.increment("retries")``.
+
+        Args:
+            key: Key to update
+            amount: Value to add
+
+        Returns:
+            New value
+
+        Raises:
+            TypeError: If the key holds a non-numeric value
+        """
+        current = self.data.get(key, 0)
+        if not isinstance(current, (int, float)) or isinstance(current, bool):
+            raise TypeError(
+                f"Cannot increment '{key}': "
+                f"value is {type(current).__name__}, not a number"
+            )
+        value: float = current + amount
+        setattr(self.data, key, value)
+        return value
+
     def has(self, key: str) -> bool:
         """Check if a key exists in the data container.
 
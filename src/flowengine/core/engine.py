@@ -15,7 +15,14 @@ import uuid
 from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import timezone
 from datetime import datetime
-from typing import Any, Literal, Optional, Protocol, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
 
 from flowengine.config.registry import (
     ComponentRegistry,
@@ -35,11 +42,23 @@ from flowengine.errors import (
 )
 from flowengine.eval.evaluator import ConditionEvaluator
 
+if TYPE_CHECKING:
+    from flowengine.core.graph import GraphExecutor
+
 logger = logging.getLogger(__name__)
 
 # Threshold for warning/enforcement about missing deadline checks (seconds)
 DEADLINE_CHECK_WARNING_THRESHOLD = 1.0
 
+# Errors that propagate from execute() unwrapped
+_PASSTHROUGH_ERRORS = (
+    FlowExecutionError,
+    FlowTimeoutError,
+    ComponentError,
+    ConditionEvaluationError,
+    ConfigurationError,
+)
+
 
 @runtime_checkable
 class ExecutionHook(Protocol):
@@ -260,35 +279,88 @@ class FlowEngine:
         Raises:
             FlowExecutionError: If execution fails and fail_fast is True
         """
-        # Create or use provided context
-        context = context or FlowContext()
-        if input_data is not None:
-            context.input = input_data
-
-        logger.info(
-            f"Starting {self.flow_type} flow execution: {context.metadata.flow_id}"
-        )
+        context = self._start_execution(context, input_data)
 
         try:
             if self.flow_type == "graph":
                 context = self._execute_graph(context)
             else:
                 context = self._execute_steps(context)
-        except (
-            FlowExecutionError,
-            FlowTimeoutError,
-            ComponentError,
-            ConditionEvaluationError,
-            ConfigurationError,
-        ):
+        except _PASSTHROUGH_ERRORS:
+            raise
+        except Exception as e:
+            raise self._flow_error(e) from e
+        finally:
+            self._mark_completed(context)
+
+        return self._finish_execution(context)
+
+    async def execute_async(
+        self,
+        context: FlowContext | None = None,
+        input_data: Any = None,
+    ) -> FlowContext:
+        """Execute the flow from async code.
+
+        Graph flows run on :meth:`GraphExecutor.execute_async`, so components
+        whose ``process`` returns a coroutine are awaited on the caller's event
+        loop. Sequential and conditional flows run :meth:`execute` in a worker
+        thread so their (synchronous) components do not block the loop.
+
+        Args:
+            context: Optional existing context (creates new if None)
+            input_data: Optional input data to attach to context
+
+        Returns:
+            Final flow context with all accumulated data
+
+        Raises:
+            FlowExecutionError: If execution fails and fail_fast is True
+        """
+        if self.flow_type != "graph":
+            return await asyncio.to_thread(self.execute, context, input_data)
+
+        context = self._start_execution(context, input_data)
+
+        try:
+            context = await self._build_graph_executor().execute_async(context)
+        except _PASSTHROUGH_ERRORS:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in flow: {e}")
-            raise FlowExecutionError(f"Flow execution failed: {e}") from e
+            raise self._flow_error(e) from e
         finally:
-            if not context.metadata.suspended:
-                context.metadata.completed_at = datetime.now(timezone.utc)
+            self._mark_completed(context)
+
+        return self._finish_execution(context)
 
+    def _start_execution(
+        self,
+        context: FlowContext | None,
+        input_data: Any,
+    ) -> FlowContext:
+        """Create or reuse the run's context, attach input and log the start."""
+        context = context or FlowContext()
+        if input_data is not None:
+            context.input = input_data
+
+        logger.info(
+            f"Starting {self.flow_type} flow execution: {context.metadata.flow_id}"
+        )
+        return context
+
+    def _flow_error(self, error: Exception) -> FlowExecutionError:
+        """Log an unexpected error and wrap it as a FlowExecutionError."""
+        logger.error(f"Unexpected error in flow: {error}")
+        return FlowExecutionError(f"Flow execution failed: {error}")
+
+    @staticmethod
+    def _mark_completed(context: FlowContext) -> None:
+        """Stamp completion time unless the run was suspended."""
+        if not context.metadata.suspended:
+            context.metadata.completed_at = datetime.now(timezone.utc)
+
+    def _finish_execution(self, context: FlowContext) -> FlowContext:
+        """Checkpoint a suspended run and log the outcome."""
         # Handle suspension checkpoint
         if context.metadata.suspended and self._checkpoint_store:
             from flowengine.core.checkpoint import Checkpoint
@@ -313,29 +385,39 @@ class FlowEngine:
     def _execute_steps(self, context: FlowContext) -> FlowContext:
         """Execute sequential/conditional flow steps."""
         # Track flow start time for timeout enforcement
-        flow_start_time = time.time()
+        flow_start_ns = time.monotonic_ns()
+        # Loop invariants, hoisted out of the per-step path
+        timeout = self.timeout
+        is_conditional = self.flow_type == "conditional"
+        execute_step = self._execute_step
+        # Looked up per run, so components replaced after construction are used
+        components = self.components
 
         for step_idx, step in enumerate(self.config.steps):
             # Calculate remaining timeout
-            elapsed = time.time() - flow_start_time
             remaining_timeout = None
-            if self.timeout:
-                remaining_timeout = self.timeout - elapsed
+            if timeout:
+                elapsed = (time.monotonic_ns() - flow_start_ns) / 1e9
+                remaining_timeout = timeout - elapsed
                 if remaining_timeout <= 0:
                     raise FlowTimeoutError(
-                        f"Flow timeout exceeded: {elapsed:.2f}s > {self.timeout}s",
-                        timeout=self.timeout,
+                        f"Flow timeout exceeded: {elapsed:.2f}s > {timeout}s",
+                        timeout=timeout,
                         elapsed=elapsed,
                         flow_id=context.metadata.flow_id,
                         step=step.component,
                     )
 
-            executed = self._execute_step(
-                step, context, remaining_timeout, step_idx
+            executed = execute_step(
+                step,
+                components[step.component],
+                context,
+                remaining_timeout,
+                step_idx,
             )
 
             # For conditional flows, stop after first matching step executes
-            if self.flow_type == "conditional" and executed is not None:
+            if is_conditional and executed is not None:
                 logger.debug(
                     f"Conditional flow: stopping after {step.component} matched"
                 )
@@ -356,9 +438,13 @@ class FlowEngine:
 
     def _execute_graph(self, context: FlowContext) -> FlowContext:
         """Execute a graph-type flow using the GraphExecutor."""
+        return self._build_graph_executor().execute(context)
+
+    def _build_graph_executor(self) -> GraphExecutor:
+        """Create a GraphExecutor for this engine's graph flow."""
         from flowengine.core.graph import GraphExecutor
 
-        executor = GraphExecutor(
+        return GraphExecutor(
             nodes=self.config.flow.nodes or [],
             edges=self.config.flow.edges or [],
             components=self.components,
@@ -366,7 +452,6 @@ class FlowEngine:
             hooks=self._hooks,
             evaluator=self.evaluator,
         )
-        return executor.execute(context)
 
     def resume(
         self,
@@ -407,6 +492,7 @@ class FlowEngine:
     def _execute_step(
         self,
         step: StepConfig,
+        component: BaseComponent,
         context: FlowContext,
         remaining_timeout: Optional[float] = None,
         step_idx: Optional[int] = None,
@@ -415,6 +501,7 @@ class FlowEngine:
 
         Args:
             step: Step configuration
+            component: Component instance resolved for this step
             context: Current flow context
             remaining_timeout: Remaining timeout in seconds (None = no timeout)
             step_idx: Index of this step in the flow definition (0-based)
@@ -426,8 +513,6 @@ class FlowEngine:
             ComponentError: If component fails and on_error is "fail"
             FlowTimeoutError: If step execution exceeds remaining timeout
         """
-        component = self.components[step.component]
-
         # Check condition
         if step.condition:
             try:
@@ -487,7 +572,7 @@ class FlowEngine:
 
         # Execute component
         logger.debug(f"Executing {step.component}")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         step_started_at = datetime.now(timezone.utc)
 
         try:
@@ -514,7 +599,7 @@ class FlowEngine:
                 context = self._execute_step_cooperative(component, context)
 
             # Record timing
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             context.metadata.record_timing(
                 step.component, elapsed, step_started_at, step_idx
             )
@@ -547,18 +632,14 @@ class FlowEngine:
 
             logger.info(f"Completed {step.component} in {elapsed:.3f}s")
 
-        except (FlowTimeoutError, DeadlineCheckError):
-            # Re-raise timeout and deadline check errors
-            elapsed = time.time() - start_time
-            context.metadata.record_timing(
-                step.component, elapsed, step_started_at, step_idx
-            )
-            raise
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             context.metadata.record_timing(
                 step.component, elapsed, step_started_at, step_idx
             )
+            # Re-raise timeout and deadline check errors
+            if isinstance(e, (FlowTimeoutError, DeadlineCheckError)):
+                raise
             context.metadata.add_error(step.component, e)
 
             logger.error(f"Error in {step.component}: {e}")
@@ -786,28 +867,12 @@ class FlowEngine:
         context = context or FlowContext()
 
         if self.flow_type == "graph":
-            from flowengine.core.graph import GraphExecutor
-
-            executor = GraphExecutor(
-                nodes=self.config.flow.nodes or [],
-                edges=self.config.flow.edges or [],
-                components=self.components,
-                settings=self.config.flow.settings,
-            )
+            executor = self._build_graph_executor()
             if executor._has_cycles:
                 # Cyclic graphs can't be topologically sorted; return all nodes
                 return [n.component for n in (self.config.flow.nodes or [])]
-            order = executor._topological_sort()
-            return [
-                self.config.flow.nodes[
-                    next(
-                        i
-                        for i, n in enumerate(self.config.flow.nodes or [])
-                        if n.id == nid
-                    )
-                ].component
-                for nid in order
-            ]
+            nodes = executor._nodes
+            return [nodes[nid].component for nid in executor._topological_sort()]
 
         executed: list[str] = []
         for step in self.config.steps:
@@ -11,7 +11,9 @@ import inspect
 import logging
 import time
 from collections import deque
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from flowengine.config.schema import FlowSettings, GraphEdgeConfig, GraphNodeConfig
@@ -33,6 +35,161 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _detect_cycles(
+    node_ids: tuple[str, ...], edge_pairs: tuple[tuple[str, str], ...]
+) -> tuple[bool, frozenset[tuple[str, str]], frozenset[str], frozenset[str]]:
+    """Detect cycles, back-edges and cycle members using an iterative DFS.
+
+    Uses white/gray/black coloring:
+    - white: unvisited
+    - gray: currently in DFS stack (ancestor)
+    - black: fully explored
+
+    An edge to a gray node is a back-edge (creates a cycle).
+
+    A node participates in a cycle if it lies on a path from a back-edge
+    target back to that back-edge's source (following forward edges); the
+    shortest such path is found by BFS for each back-edge.
+
+    The result depends only on the graph's shape, so it is memoized: flows
+    rebuilt from the same configuration skip the traversal. Inputs are kept
+    in declaration order, which decides where the DFS starts and therefore
+    which edge of a cycle is reported as the back-edge.
+
+    Args:
+        node_ids: Node ids in declaration order
+        edge_pairs: ``(source_id, target_id)`` pairs in declaration order
+
+    Returns:
+        Tuple of (has_cycles, back_edges, back_edge_targets, cycle_nodes)
+        where back_edges holds the (source_id, target_id) pairs that create
+        cycles.
+    """
+    # Intern ids as dense ints: the traversal indexes lists and a bytearray
+    # instead of hashing strings; ids are mapped back only for the results
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    forward: list[list[int]] = [[] for _ in node_ids]
+    # Parallel edges (same source and target) cannot change the outcome, so
+    # each pair is walked once; dict.fromkeys keeps first-seen order
+    for source, target in dict.fromkeys(edge_pairs):
+        forward[index[source]].append(index[target])
+
+    white, gray, black = 0, 1, 2
+    color = bytearray(len(node_ids))  # all white
+    back_edges: set[tuple[int, int]] = set()
+
+    # Explicit stack of (node, remaining successors) instead of recursion,
+    # so long chains cost no Python frames and cannot hit the recursion limit
+    stack: list[tuple[int, Iterator[int]]] = []
+    for root in range(len(node_ids)):
+        if color[root] != white:
+            continue
+        color[root] = gray
+        stack.append((root, iter(forward[root])))
+        while stack:
+            node, successors = stack[-1]
+            for succ in successors:
+                if color[succ] == gray:
+                    # Back-edge: succ is an ancestor in current DFS path
+                    back_edges.add((node, succ))
+                elif color[succ] == white:
+                    color[succ] = gray
+                    stack.append((succ, iter(forward[succ])))
+                    break
+            else:
+                color[node] = black
+                stack.pop()
+
+    cycle_nodes: set[int] = set()
+    for u, v in back_edges:
+        # BFS from the back-edge target v, looking for its source u, through
+        # forward edges (excluding back-edges)
+        visited: set[int] = set()
+        queue: deque[int] = deque([v])
+        parent: dict[int, int] = {v: -1}
+
+        while queue:
+            current = queue.popleft()
+            if current in visited:
+                continue
+            visited.add(current)
+
+            if current == u:
+                # Trace path from target to source — all nodes are cycle nodes
+                path_node = u
+                while path_node != -1:
+                    cycle_nodes.add(path_node)
+                    path_node = parent[path_node]
+                break
+
+            for successor in forward[current]:
+                if (current, successor) in back_edges:
+                    continue
+                if successor not in visited:
+                    parent[successor] = current
+                    queue.append(successor)
+
+    return (
+        len(back_edges) > 0,
+        frozenset((node_ids[u], node_ids[v]) for u, v in back_edges),
+        frozenset(node_ids[v] for _, v in back_edges),
+        frozenset(node_ids[i] for i in cycle_nodes),
+    )
+
+
+@lru_cache(maxsize=256)
+def _topological_order(
+    node_ids: tuple[str, ...], edge_pairs: tuple[tuple[str, str], ...]
+) -> tuple[str, ...]:
+    """Kahn's algorithm — returns execution order.
+
+    Like :func:`_detect_cycles` this depends only on the graph's shape, so
+    it runs once per shape rather than once per execution. Cycles raise and
+    are therefore never cached.
+
+    Args:
+        node_ids: Node ids in declaration order
+        edge_pairs: ``(source_id, target_id)`` pairs in declaration order
+
+    Returns:
+        Node ids in execution order
+
+    Raises:
+        ConfigurationError: If cycle detected.
+    """
+    in_degree: dict[str, int] = dict.fromkeys(node_ids, 0)
+    forward: dict[str, list[str]] = {node_id: [] for node_id in node_ids}
+    for source, target in edge_pairs:
+        in_degree[target] += 1
+        forward[source].append(target)
+
+    queue: deque[str] = deque()
+    for nid, degree in in_degree.items():
+        if degree == 0:
+            queue.append(nid)
+
+    order: list[str] = []
+    while queue:
+        node_id = queue.popleft()
+        order.append(node_id)
+        for target in forward[node_id]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                queue.append(target)
+
+    if len(order) != len(node_ids):
+        raise ConfigurationError(
+            "Cycle detected in graph flow",
+            details=[
+                f"Processed {len(order)} of {len(node_ids)} nodes. "
+                f"Remaining nodes are part of a cycle."
+            ],
+        )
+
+    return tuple(order)
+
+
 class GraphExecutor:
     """Executes a graph-type flow using topological ordering with port-based routing.
 
@@ -66,13 +223,26 @@ class GraphExecutor:
         self._forward: dict[str, list[GraphEdgeConfig]] = {}
         self._reverse: dict[str, list[GraphEdgeConfig]] = {}
         self._build_adjacency()
-
-        # Detect cycles at construction time
-        self._has_cycles, self._back_edges = self._detect_cycles()
-        self._back_edge_targets: set[str] = {
-            target for _, target in self._back_edges
+        # Port routing table: node -> active port -> edges passing the port check
+        self._routes: dict[str, dict[str | None, list[GraphEdgeConfig]]] = {
+            node_id: self._build_routes(outgoing)
+            for node_id, outgoing in self._forward.items()
         }
 
+        # Graph shape: the key for analyses memoized across executors
+        self._shape = (
+            tuple(self._nodes),
+            tuple((e.source, e.target) for e in edges),
+        )
+
+        # Detect cycles at construction time (memoized per graph shape)
+        (
+            self._has_cycles,
+            self._back_edges,
+            self._back_edge_targets,
+            self._cycle_nodes,
+        ) = _detect_cycles(*self._shape)
+
     def execute(self, context: FlowContext) -> FlowContext:
         """Execute the graph flow (synchronous components only).
 
@@ -80,6 +250,7 @@ class GraphExecutor:
         executor for graphs containing cycles. For graphs whose components have
         async ``process`` coroutines, use :meth:`execute_async`.
         """
+        self._load_settings()
         if self._has_cycles:
             return self._execute_cyclic(context)
         return self._execute_dag(context)
@@ -92,16 +263,33 @@ class GraphExecutor:
         components run inline. Routing, port/condition gating, cycle handling,
         suspension and hooks are identical to the sync path.
         """
+        self._load_settings()
         if self._has_cycles:
             return await self._execute_cyclic_async(context)
         return await self._execute_dag_async(context)
 
+    def _load_settings(self) -> None:
+        """Copy the settings consulted on every node visit off the model.
+
+        Read per run rather than in ``__init__``, so changes to the settings
+        or to node ``max_visits`` take effect on a reused executor.
+        """
+        settings = self._settings
+        self._timeout = settings.timeout_seconds
+        self._fail_fast = settings.fail_fast
+        self._max_iterations = max_iterations = settings.max_iterations
+        # Per-node visit limits: max_visits if set, else flow max_iterations
+        self._max_visits = {
+            node_id: node.max_visits if node.max_visits is not None else max_iterations
+            for node_id, node in self._nodes.items()
+        }
+
     def _execute_node(
         self,
         node_id: str,
         node: GraphNodeConfig,
         context: FlowContext,
-        flow_start_time: float,
+        flow_start_ns: int,
     ) -> FlowContext:
         """Execute a single node with full lifecycle.
 
@@ -123,14 +311,13 @@ class GraphExecutor:
             )
 
         # Calculate remaining timeout
-        elapsed = time.time() - flow_start_time
-        if self._settings.timeout_seconds:
-            remaining = self._settings.timeout_seconds - elapsed
+        elapsed = (time.monotonic_ns() - flow_start_ns) / 1e9
+        if self._timeout:
+            remaining = self._timeout - elapsed
             if remaining <= 0:
                 raise FlowTimeoutError(
-                    f"Flow timeout exceeded: {elapsed:.2f}s > "
-                    f"{self._settings.timeout_seconds}s",
-                    timeout=self._settings.timeout_seconds,
+                    f"Flow timeout exceeded: {elapsed:.2f}s > {self._timeout}s",
+                    timeout=self._timeout,
                     elapsed=elapsed,
                     flow_id=context.metadata.flow_id,
                     step=node_id,
@@ -143,7 +330,7 @@ class GraphExecutor:
 
         self._notify("on_node_start", node_id, node.component, context)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         step_started_at = datetime.now(UTC)
 
         try:
@@ -162,7 +349,7 @@ class GraphExecutor:
                 component.teardown(context)
                 context.metadata.deadline = None
 
-            node_elapsed = time.time() - start_time
+            node_elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             context.metadata.record_timing(
                 node.component, node_elapsed, step_started_at
             )
@@ -176,17 +363,13 @@ class GraphExecutor:
 
             logger.info(f"Completed node {node_id} in {node_elapsed:.3f}s")
 
-        except FlowTimeoutError:
-            node_elapsed = time.time() - start_time
-            context.metadata.record_timing(
-                node.component, node_elapsed, step_started_at
-            )
-            raise
         except Exception as e:
-            node_elapsed = time.time() - start_time
+            node_elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             context.metadata.record_timing(
                 node.component, node_elapsed, step_started_at
             )
+            if isinstance(e, FlowTimeoutError):
+                raise
             context.metadata.add_error(node.component, e)
 
             self._notify(
@@ -195,7 +378,7 @@ class GraphExecutor:
 
             logger.error(f"Error in node {node_id}: {e}")
 
-            if node.on_error == "fail" or self._settings.fail_fast:
+            if node.on_error == "fail" or self._fail_fast:
                 raise ComponentError(
                     component=node.component,
                     message=str(e),
@@ -216,7 +399,7 @@ class GraphExecutor:
         This is the original execute() logic, preserved unchanged for
         acyclic graphs.
         """
-        flow_start_time = time.time()
+        flow_start_ns = time.monotonic_ns()
 
         # Get execution order
         order = self._topological_sort()
@@ -226,12 +409,17 @@ class GraphExecutor:
         roots = set(self._find_roots())
         activated: set[str] = set(roots)
 
+        # Nodes completed before this run (resume support). Each node is
+        # visited once in topological order, so a set snapshot answers
+        # membership in O(1) without changing the public list.
+        previously_completed = set(context.metadata.completed_nodes)
+
         for node_id in order:
             node = self._nodes[node_id]
 
             # Skip already-completed nodes (resume support)
             # But still propagate activation to downstream nodes
-            if node_id in context.metadata.completed_nodes:
+            if node_id in previously_completed:
                 logger.debug(f"Skipping already-completed node: {node_id}")
                 # Propagate unconditional edges (we don't know the port from before)
                 reachable_targets = self._get_reachable_targets(node_id, None, context)
@@ -248,7 +436,7 @@ class GraphExecutor:
                 continue
 
             # Execute the node
-            context = self._execute_node(node_id, node, context, flow_start_time)
+            context = self._execute_node(node_id, node, context, flow_start_ns)
 
             # Check for suspension — do NOT mark node as completed so it
             # re-runs on resume (e.g., HumanApproval re-processes with
@@ -282,10 +470,10 @@ class GraphExecutor:
         - A per-node max_visits limit is reached
         - Global timeout expires
         """
-        flow_start_time = time.time()
+        flow_start_ns = time.monotonic_ns()
 
-        # Identify which nodes participate in cycles
-        cycle_nodes = self._identify_cycle_nodes()
+        # Nodes that participate in cycles (from the construction-time analysis)
+        cycle_nodes = self._cycle_nodes
 
         # Find roots: nodes with no incoming non-back-edges
         roots = self._find_roots_for_cyclic()
@@ -302,44 +490,44 @@ class GraphExecutor:
         else:
             ready_queue.extend(roots)
 
-        iter_start: float | None = None  # Track iteration start for duration
+        iter_start: int | None = None  # Track iteration start for duration
 
         while ready_queue:
             node_id = ready_queue.popleft()
             node = self._nodes[node_id]
 
             # 1. Check per-node visit limit
-            effective_max = self._effective_max_visits(node_id)
-            if visit_counts.get(node_id, 0) >= effective_max:
+            if visit_counts.get(node_id, 0) >= self._max_visits[node_id]:
                 continue  # This path is exhausted
 
             # 2. Check iteration limit (only at back-edge targets that have
             #    already been visited — first visit is not a "loop")
             if node_id in self._back_edge_targets and visit_counts.get(node_id, 0) > 0:
                 # The previous iteration just completed
-                iter_end = time.time()
+                iter_end = time.monotonic_ns()
                 self._notify(
                     "on_iteration_complete", iteration, node_id, context,
-                    iter_end - (iter_start if iter_start else flow_start_time),
+                    (iter_end - (iter_start or flow_start_ns)) / 1e9,
                 )
 
                 iteration += 1
                 context.metadata.iteration_count = iteration
-                iter_start = time.time()
+                iter_start = time.monotonic_ns()
 
                 # Fire iteration start hook
                 self._notify("on_iteration_start", iteration, node_id, context)
 
-                if iteration > self._settings.max_iterations:
+                if iteration > self._max_iterations:
                     self._handle_max_iterations(context, node_id, iteration)
                     break
 
             # 3. Execute the node
-            context = self._execute_node(node_id, node, context, flow_start_time)
+            context = self._execute_node(node_id, node, context, flow_start_ns)
 
-            # 4. Update visit tracking
+            # 4. Update visit tracking (in place; metadata holds the live dict)
             visit_counts[node_id] = visit_counts.get(node_id, 0) + 1
-            context.metadata.node_visit_counts = dict(visit_counts)
+            if context.metadata.node_visit_counts is not visit_counts:
+                context.metadata.node_visit_counts = visit_counts
 
             # 5. Handle suspension (checkpoint/resume)
             if context.metadata.suspended:
@@ -363,7 +551,7 @@ class GraphExecutor:
 
         # Fire on_iteration_complete for the final iteration (natural exit)
         if iteration > 0 and not context.metadata.suspended:
-            iter_end = time.time()
+            iter_end = time.monotonic_ns()
             # Use the last back-edge target as entry node, or first root
             entry_node = (
                 list(self._back_edge_targets)[0]
@@ -371,7 +559,7 @@ class GraphExecutor:
             )
             self._notify(
                 "on_iteration_complete", iteration, entry_node, context,
-                iter_end - (iter_start if iter_start else flow_start_time),
+                (iter_end - (iter_start or flow_start_ns)) / 1e9,
             )
 
         return context
@@ -386,7 +574,7 @@ class GraphExecutor:
         node_id: str,
         node: GraphNodeConfig,
         context: FlowContext,
-        flow_start_time: float,
+        flow_start_ns: int,
     ) -> FlowContext:
         """Async twin of :meth:`_execute_node` (awaits coroutine ``process``)."""
         component = self._components.get(node.component)
@@ -395,14 +583,13 @@ class GraphExecutor:
                 f"Component not found for node '{node_id}': {node.component}"
             )
 
-        elapsed = time.time() - flow_start_time
-        if self._settings.timeout_seconds:
-            remaining = self._settings.timeout_seconds - elapsed
+        elapsed = (time.monotonic_ns() - flow_start_ns) / 1e9
+        if self._timeout:
+            remaining = self._timeout - elapsed
             if remaining <= 0:
                 raise FlowTimeoutError(
-                    f"Flow timeout exceeded: {elapsed:.2f}s > "
-                    f"{self._settings.timeout_seconds}s",
-                    timeout=self._settings.timeout_seconds,
+                    f"Flow timeout exceeded: {elapsed:.2f}s > {self._timeout}s",
+                    timeout=self._timeout,
                     elapsed=elapsed,
                     flow_id=context.metadata.flow_id,
                     step=node_id,
@@ -413,7 +600,7 @@ class GraphExecutor:
         context.clear_port()
         self._notify("on_node_start", node_id, node.component, context)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         step_started_at = datetime.now(UTC)
 
         try:
@@ -433,24 +620,22 @@ class GraphExecutor:
                 component.teardown(context)
                 context.metadata.deadline = None
 
-            node_elapsed = time.time() - start_time
+            node_elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             context.metadata.record_timing(node.component, node_elapsed, step_started_at)
             self._notify(
                 "on_node_complete", node_id, node.component, context, node_elapsed
             )
             logger.info(f"Completed node {node_id} in {node_elapsed:.3f}s")
 
-        except FlowTimeoutError:
-            node_elapsed = time.time() - start_time
-            context.metadata.record_timing(node.component, node_elapsed, step_started_at)
-            raise
         except Exception as e:
-            node_elapsed = time.time() - start_time
+            node_elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             context.metadata.record_timing(node.component, node_elapsed, step_started_at)
+            if isinstance(e, FlowTimeoutError):
+                raise
             context.metadata.add_error(node.component, e)
             self._notify("on_node_error", node_id, node.component, e, context)
             logger.error(f"Error in node {node_id}: {e}")
-            if node.on_error == "fail" or self._settings.fail_fast:
+            if node.on_error == "fail" or self._fail_fast:
                 raise ComponentError(
                     component=node.component, message=str(e), original_error=e
                 ) from e
@@ -464,14 +649,15 @@ class GraphExecutor:
 
     async def _execute_dag_async(self, context: FlowContext) -> FlowContext:
         """Async twin of :meth:`_execute_dag`."""
-        flow_start_time = time.time()
+        flow_start_ns = time.monotonic_ns()
         order = self._topological_sort()
         roots = set(self._find_roots())
         activated: set[str] = set(roots)
+        previously_completed = set(context.metadata.completed_nodes)
 
         for node_id in order:
             node = self._nodes[node_id]
-            if node_id in context.metadata.completed_nodes:
+            if node_id in previously_completed:
                 activated.update(self._get_reachable_targets(node_id, None, context))
                 continue
             if node_id not in activated:
@@ -481,7 +667,7 @@ class GraphExecutor:
                 continue
 
             context = await self._execute_node_async(
-                node_id, node, context, flow_start_time
+                node_id, node, context, flow_start_ns
             )
             if context.metadata.suspended:
                 self._notify(
@@ -499,8 +685,8 @@ class GraphExecutor:
 
     async def _execute_cyclic_async(self, context: FlowContext) -> FlowContext:
         """Async twin of :meth:`_execute_cyclic`."""
-        flow_start_time = time.time()
-        cycle_nodes = self._identify_cycle_nodes()
+        flow_start_ns = time.monotonic_ns()
+        cycle_nodes = self._cycle_nodes
         roots = self._find_roots_for_cyclic()
         visit_counts: dict[str, int] = dict(context.metadata.node_visit_counts)
         iteration = context.metadata.iteration_count
@@ -511,33 +697,34 @@ class GraphExecutor:
         else:
             ready_queue.extend(roots)
 
-        iter_start: float | None = None
+        iter_start: int | None = None
         while ready_queue:
             node_id = ready_queue.popleft()
             node = self._nodes[node_id]
 
-            if visit_counts.get(node_id, 0) >= self._effective_max_visits(node_id):
+            if visit_counts.get(node_id, 0) >= self._max_visits[node_id]:
                 continue
 
             if node_id in self._back_edge_targets and visit_counts.get(node_id, 0) > 0:
-                iter_end = time.time()
+                iter_end = time.monotonic_ns()
                 self._notify(
                     "on_iteration_complete", iteration, node_id, context,
-                    iter_end - (iter_start if iter_start else flow_start_time),
+                    (iter_end - (iter_start or flow_start_ns)) / 1e9,
                 )
                 iteration += 1
                 context.metadata.iteration_count = iteration
-                iter_start = time.time()
+                iter_start = time.monotonic_ns()
                 self._notify("on_iteration_start", iteration, node_id, context)
-                if iteration > self._settings.max_iterations:
+                if iteration > self._max_iterations:
                     self._handle_max_iterations(context, node_id, iteration)
                     break
 
             context = await self._execute_node_async(
-                node_id, node, context, flow_start_time
+                node_id, node, context, flow_start_ns
             )
             visit_counts[node_id] = visit_counts.get(node_id, 0) + 1
-            context.metadata.node_visit_counts = dict(visit_counts)
+            if context.metadata.node_visit_counts is not visit_counts:
+                context.metadata.node_visit_counts = visit_counts
 
             if context.metadata.suspended:
                 self._notify(
@@ -554,14 +741,14 @@ class GraphExecutor:
                 ready_queue.append(target)
 
         if iteration > 0 and not context.metadata.suspended:
-            iter_end = time.time()
+            iter_end = time.monotonic_ns()
             entry_node = (
                 list(self._back_edge_targets)[0]
                 if self._back_edge_targets else roots[0]
             )
             self._notify(
                 "on_iteration_complete", iteration, entry_node, context,
-                iter_end - (iter_start if iter_start else flow_start_time),
+                (iter_end - (iter_start or flow_start_ns)) / 1e9,
             )
         return context
 
@@ -577,6 +764,23 @@ class GraphExecutor:
             self._forward[edge.source].append(edge)
             self._reverse[edge.target].append(edge)
 
+    @staticmethod
+    def _build_routes(
+        outgoing: list[GraphEdgeConfig],
+    ) -> dict[str | None, list[GraphEdgeConfig]]:
+        """Group a node's outgoing edges by the active port that lets them pass.
+
+        The ``None`` entry holds the unconditional edges, used when no port
+        is set or the active port has no edges of its own. Each entry keeps
+        declaration order, so targets are activated in edge order.
+        """
+        routes: dict[str | None, list[GraphEdgeConfig]] = {
+            None: [e for e in outgoing if e.port is None]
+        }
+        for port in {e.port for e in outgoing if e.port is not None}:
+            routes[port] = [e for e in outgoing if e.port is None or e.port == port]
+        return routes
+
     def _find_roots(self) -> list[str]:
         """Find nodes with no incoming edges (entry points for DAG)."""
         return [
@@ -605,39 +809,12 @@ class GraphExecutor:
         return roots
 
     def _topological_sort(self) -> list[str]:
-        """Kahn's algorithm — returns execution order.
+        """Return the DAG execution order (memoized per graph shape).
 
         Raises:
             ConfigurationError: If cycle detected.
         """
-        in_degree: dict[str, int] = dict.fromkeys(self._nodes, 0)
-        for edge in self._edges:
-            in_degree[edge.target] += 1
-
-        queue: deque[str] = deque()
-        for nid, degree in in_degree.items():
-            if degree == 0:
-                queue.append(nid)
-
-        order: list[str] = []
-        while queue:
-            node_id = queue.popleft()
-            order.append(node_id)
-            for edge in self._forward[node_id]:
-                in_degree[edge.target] -= 1
-                if in_degree[edge.target] == 0:
-                    queue.append(edge.target)
-
-        if len(order) != len(self._nodes):
-            raise ConfigurationError(
-                "Cycle detected in graph flow",
-                details=[
-                    f"Processed {len(order)} of {len(self._nodes)} nodes. "
-                    f"Remaining nodes are part of a cycle."
-                ],
-            )
-
-        return order
+        return list(_topological_order(*self._shape))
 
     def _get_reachable_targets(
         self, node_id: str, active_port: str | None, context: FlowContext | None = None
@@ -656,23 +833,13 @@ class GraphExecutor:
         ``condition`` expression activates only if it evaluates True against
         ``context``. Evaluation errors follow ``settings.on_condition_error``.
         """
-        outgoing = self._forward.get(node_id, [])
-        if not outgoing:
+        routes = self._routes.get(node_id)
+        if routes is None:
             return []
 
-        has_port_edges = any(e.port is not None for e in outgoing)
-
         targets: list[str] = []
-        for edge in outgoing:
-            if edge.port is None:
-                port_ok = True
-            elif has_port_edges and active_port is not None:
-                port_ok = edge.port == active_port
-            elif not has_port_edges:
-                port_ok = True
-            else:
-                port_ok = False
-            if port_ok and self._edge_condition_ok(edge, context):
+        for edge in routes.get(active_port, routes[None]):
+            if self._edge_condition_ok(edge, context):
                 targets.append(edge.target)
 
         return targets
@@ -706,93 +873,6 @@ class GraphExecutor:
                 )
             return False
 
-    def _detect_cycles(self) -> tuple[bool, set[tuple[str, str]]]:
-        """Detect cycles and identify back-edges using DFS.
-
-        Uses white/gray/black coloring:
-        - white: unvisited
-        - gray: currently in DFS stack (ancestor)
-        - black: fully explored
-
-        An edge to a gray node is a back-edge (creates a cycle).
-
-        Returns:
-            Tuple of (has_cycles, back_edges) where back_edges is a set of
-            (source_id, target_id) tuples that create cycles.
-        """
-        white, gray, black = 0, 1, 2
-        color: dict[str, int] = dict.fromkeys(self._nodes, white)
-        back_edges: set[tuple[str, str]] = set()
-
-        def dfs(node_id: str) -> None:
-            color[node_id] = gray
-            for edge in self._forward.get(node_id, []):
-                target = edge.target
-                if color[target] == gray:
-                    # Back-edge: target is an ancestor in current DFS path
-                    back_edges.add((node_id, target))
-                elif color[target] == white:
-                    dfs(target)
-            color[node_id] = black
-
-        for node_id in self._nodes:
-            if color[node_id] == white:
-                dfs(node_id)
-
-        return (len(back_edges) > 0, back_edges)
-
-    def _identify_cycle_nodes(self) -> set[str]:
-        """Find all nodes that participate in any cycle.
-
-        A node participates in a cycle if it lies on a path from a
-        back-edge target back to a back-edge source (following forward edges).
-        """
-        if not self._back_edges:
-            return set()
-
-        cycle_nodes: set[str] = set()
-        for source, target in self._back_edges:
-            # Find all nodes on paths from target to source (the cycle body)
-            # BFS from target, looking for source, through forward edges
-            # (excluding the back-edge itself)
-            visited: set[str] = set()
-            queue: deque[str] = deque([target])
-            parent: dict[str, str | None] = {target: None}
-
-            while queue:
-                current = queue.popleft()
-                if current in visited:
-                    continue
-                visited.add(current)
-
-                if current == source:
-                    # Trace path from target to source — all nodes are cycle nodes
-                    path_node: str | None = source
-                    while path_node is not None:
-                        cycle_nodes.add(path_node)
-                        path_node = parent.get(path_node)
-                    break
-
-                for edge in self._forward.get(current, []):
-                    # Don't follow this back-edge
-                    if (edge.source, edge.target) in self._back_edges:
-                        continue
-                    if edge.target not in visited:
-                        parent[edge.target] = current
-                        queue.append(edge.target)
-
-        return cycle_nodes
-
-    def _effective_max_visits(self, node_id: str) -> int:
-        """Return the effective visit limit for a node.
-
-        Uses per-node max_visits if set, otherwise flow-level max_iterations.
-        """
-        node = self._nodes[node_id]
-        if node.max_visits is not None:
-            return node.max_visits
-        return self._settings.max_iterations
-
     def _handle_max_iterations(
         self, context: FlowContext, node_id: str, iteration: int
     ) -> None:
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import ast
 import logging
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from types import CodeType
+from typing import TYPE_CHECKING, Any
 
 from flowengine.errors import ConditionEvaluationError
 from flowengine.eval.safe_ast import SafeASTValidator
@@ -42,6 +44,29 @@ class ConditionEvaluator:
     def __init__(self) -> None:
         """Initialize evaluator with AST validator."""
         self.validator = SafeASTValidator()
+        # Globals shared by every evaluation: no builtins reachable
+        self._globals: dict[str, Any] = {"__builtins__": {}}
+
+    def compile_condition(self, condition: str) -> CodeType:
+        """Parse, validate and compile a condition expression.
+
+        With the default validator, successful compilations are cached per
+        expression string (up to 256 entries, shared by all evaluators), so
+        a condition is normally parsed and validated only once per process.
+        A replaced validator is applied on every call, uncached.
+
+        Args:
+            condition: Python expression string
+
+        Returns:
+            Compiled code object ready for evaluation
+
+        Raises:
+            ConditionEvaluationError: If condition is unsafe or invalid
+        """
+        if type(self.validator) is SafeASTValidator:
+            return _compile_condition(condition)
+        return _compile(condition, self.validator)
 
     def evaluate(self, condition: str, context: FlowContext) -> bool:
         """Evaluate a condition expression.
@@ -56,37 +81,11 @@ class ConditionEvaluator:
         Raises:
             ConditionEvaluationError: If condition is unsafe or invalid
         """
-        # Parse to AST
-        try:
-            tree = ast.parse(condition, mode="eval")
-        except SyntaxError as e:
-            raise ConditionEvaluationError(
-                f"Invalid syntax: {e}",
-                condition=condition,
-            ) from e
-
-        # Validate safety
-        if not self.validator.validate(tree):
-            raise ConditionEvaluationError(
-                f"Unsafe condition: {self.validator.errors}",
-                condition=condition,
-            )
+        code = self.compile_condition(condition)
 
-        # Build safe namespace
-        namespace = {
-            "context": context,
-            "True": True,
-            "False": False,
-            "None": None,
-        }
-
-        # Evaluate
+        # Evaluate (True/False/None are keywords, so only 'context' is bound)
         try:
-            result = eval(
-                compile(tree, "<condition>", "eval"),
-                {"__builtins__": {}},
-                namespace,
-            )
+            result = eval(code, self._globals, {"context": context})
             return bool(result)
         except Exception as e:
             # Runtime errors (e.g., AttributeError for missing attributes)
@@ -132,3 +131,35 @@ class ConditionEvaluator:
             errors.extend(self.validator.errors)
 
         return errors
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> CodeType:
+    """Compile a condition with the default validator, memoized by string.
+
+    Validation is a pure function of the parsed expression, so the string
+    alone is the key. Each miss uses a fresh validator, since validators
+    keep per-call error state. Failures raise and are therefore never cached.
+    """
+    return _compile(condition, SafeASTValidator())
+
+
+def _compile(condition: str, validator: SafeASTValidator) -> CodeType:
+    """Parse, validate and compile a condition."""
+    # Parse to AST
+    try:
+        tree = ast.parse(condition, mode="eval")
+    except SyntaxError as e:
+        raise ConditionEvaluationError(
+            f"Invalid syntax: {e}",
+            condition=condition,
+        ) from e
+
+    # Validate safety
+    if not validator.validate(tree):
+        raise ConditionEvaluationError(
+            f"Unsafe condition: {validator.errors}",
+            condition=condition,
+        )
+
+    return compile(tree, "<condition>", "eval")
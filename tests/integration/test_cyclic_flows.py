@@ -29,9 +29,7 @@ class PlannerComponent(BaseComponent):
         steps = context.get("steps", 0) + 1
         context.set("steps", steps)
         context.set("current_plan", f"Research plan v{steps}")
-        log = context.get("log", [])
-        log.append(f"plan:{steps}")
-        context.set("log", log)
+        context.setdefault("log", []).append(f"plan:{steps}")
         return context
 
 
@@ -39,13 +37,9 @@ class SearchComponent(BaseComponent):
     """Simulates searching. Accumulates findings."""
 
     def process(self, context: FlowContext) -> FlowContext:
-        findings = context.get("findings", [])
         step = context.get("steps", 0)
-        findings.append(f"finding-{step}")
-        context.set("findings", findings)
-        log = context.get("log", [])
-        log.append(f"search:{step}")
-        context.set("log", log)
+        context.setdefault("findings", []).append(f"finding-{step}")
+        context.setdefault("log", []).append(f"search:{step}")
         return context
 
 
@@ -55,9 +49,7 @@ class SynthesizeComponent(BaseComponent):
     def process(self, context: FlowContext) -> FlowContext:
         findings = context.get("findings", [])
         context.set("summary", f"Synthesis of {len(findings)} findings")
-        log = context.get("log", [])
-        log.append(f"synthesize:{len(findings)}")
-        context.set("log", log)
+        context.setdefault("log", []).append(f"synthesize:{len(findings)}")
         return context
 
 
@@ -70,9 +62,7 @@ class EvaluateComponent(BaseComponent):
         quality = len(findings)
         context.set("quality_score", quality)
 
-        log = context.get("log", [])
-        log.append(f"evaluate:{quality}")
-        context.set("log", log)
+        context.setdefault("log", []).append(f"evaluate:{quality}")
 
         if quality >= quality_threshold:
             self.set_output_port(context, "done")
@@ -88,9 +78,7 @@ class DeliverComponent(BaseComponent):
     def process(self, context: FlowContext) -> FlowContext:
         context.set("delivered", True)
         context.set("final_summary", context.get("summary", "No summary"))
-        log = context.get("log", [])
-        log.append("deliver")
-        context.set("log", log)
+        context.setdefault("log", []).append("deliver")
         return context
 
 
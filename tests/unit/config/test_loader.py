@@ -78,6 +78,26 @@ flow:
         assert config.name == "String Flow"
         assert len(config.components) == 1
 
+    def test_loads_returns_independent_copies(self) -> None:
+        """Test repeated loads of the same YAML don't share mutable state."""
+        yaml_str = """
+name: "Cached Flow"
+components:
+  - name: test
+    type: myapp.Test
+    config:
+      key: value
+flow:
+  steps:
+    - component: test
+"""
+        first = ConfigLoader.loads(yaml_str)
+        first.components[0].config["key"] = "mutated"
+
+        second = ConfigLoader.loads(yaml_str)
+        assert second is not first
+        assert second.components[0].config == {"key": "value"}
+
     def test_loads_invalid_yaml(self) -> None:
         """Test loads with invalid YAML raises error."""
         with pytest.raises(ConfigurationError, match="Invalid YAML"):
@@ -122,6 +142,39 @@ flow:
 
         assert "validation failed" in str(exc_info.value).lower()
 
+    def test_from_json(self) -> None:
+        """Test loading configuration from JSON text and bytes."""
+        data = (
+            '{"name": "JSON Flow",'
+            ' "components": [{"name": "test", "type": "myapp.Test"}],'
+            ' "flow": {"steps": [{"component": "test"}]}}'
+        )
+
+        for payload in (data, data.encode()):
+            config = ConfigLoader.from_json(payload)
+            assert config.name == "JSON Flow"
+            assert config.steps[0].component == "test"
+
+    def test_from_json_invalid(self) -> None:
+        """Test from_json reports malformed JSON and schema errors."""
+        with pytest.raises(ConfigurationError, match="Invalid JSON"):
+            ConfigLoader.from_json("{not json")
+
+        with pytest.raises(ConfigurationError, match="validation failed"):
+            ConfigLoader.from_json('{"name": "Test"}')
+
+    def test_from_json_empty(self) -> None:
+        """Test from_json with a null document raises the empty error."""
+        with pytest.raises(ConfigurationError, match="Configuration is empty"):
+            ConfigLoader.from_json("null")
+
+    def test_from_json_not_object(self) -> None:
+        """Test from_json with a non-object document raises error."""
+        with pytest.raises(
+            ConfigurationError, match="must be a dictionary, got list"
+        ):
+            ConfigLoader.from_json("[]")
+
     def test_load_with_all_features(self) -> None:
         """Test loading config with all features."""
         yaml_str = """
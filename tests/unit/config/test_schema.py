@@ -11,6 +11,58 @@ from flowengine.config.schema import (
     StepConfig,
 )
 
+# Shared read-only building blocks (validated once at import)
+_TEST_COMPONENT = ComponentConfig(name="test", type="myapp.Test")
+_TEST_STEP = StepConfig(component="test")
+
+# Keep this module on one worker under --dist loadgroup so its
+# module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("config_schema")
+
+
+@pytest.fixture(scope="module")
+def minimal_flow_config() -> FlowConfig:
+    """Minimal valid FlowConfig, built once per module (read-only)."""
+    return FlowConfig(
+        name="Test Flow",
+        components=[
+            _TEST_COMPONENT,
+        ],
+        flow=FlowDefinition(
+            steps=[_TEST_STEP],
+        ),
+    )
+
+
+class TestValidationErrors:
+    """Invalid input rejected at the expected field, across schema models."""
+
+    @pytest.mark.parametrize(
+        ("model_cls", "kwargs", "loc"),
+        [
+            pytest.param(ComponentConfig, {"type": "myapp.Test"}, ("name",),
+                         id="component-missing-name"),
+            pytest.param(ComponentConfig, {"name": "test"}, ("type",),
+                         id="component-missing-type"),
+            pytest.param(FlowSettings, {"timeout_seconds": 0}, ("timeout_seconds",),
+                         id="settings-zero-timeout"),
+            pytest.param(FlowSettings, {"timeout_seconds": -1}, ("timeout_seconds",),
+                         id="settings-negative-timeout"),
+            pytest.param(StepConfig, {"component": "test", "on_error": "invalid"},
+                         ("on_error",), id="step-invalid-on-error"),
+            pytest.param(FlowDefinition, {"steps": []}, (),
+                         id="definition-empty-steps"),
+        ],
+    )
+    def test_validation_errors(
+        self, model_cls: type, kwargs: dict, loc: tuple
+    ) -> None:
+        """Test invalid model input raises ValidationError at the expected field."""
+        with pytest.raises(ValidationError) as exc_info:
+            model_cls(**kwargs)
+
+        assert exc_info.value.errors()[0]["loc"] == loc
+
 
 class TestComponentConfig:
     """Tests for ComponentConfig model."""
@@ -37,16 +89,6 @@ class TestComponentConfig:
         assert config.name == "test"
         assert config.config == {}
 
-    def test_missing_name_raises(self) -> None:
-        """Test missing name raises validation error."""
-        with pytest.raises(ValidationError):
-            ComponentConfig(type="myapp.Test")  # type: ignore
-
-    def test_missing_type_raises(self) -> None:
-        """Test missing type raises validation error."""
-        with pytest.raises(ValidationError):
-            ComponentConfig(name="test")  # type: ignore
-
 
 class TestFlowSettings:
     """Tests for FlowSettings model."""
@@ -68,14 +110,6 @@ class TestFlowSettings:
         assert settings.fail_fast is False
         assert settings.timeout_seconds == 60.0
 
-    def test_timeout_must_be_positive(self) -> None:
-        """Test timeout must be positive."""
-        with pytest.raises(ValidationError):
-            FlowSettings(timeout_seconds=0)
-
-        with pytest.raises(ValidationError):
-            FlowSettings(timeout_seconds=-1)
-
 
 class TestStepConfig:
     """Tests for StepConfig model."""
@@ -103,16 +137,11 @@ class TestStepConfig:
         assert step.condition == "context.data.ready == True"
         assert step.on_error == "skip"
 
-    def test_on_error_values(self) -> None:
+    @pytest.mark.parametrize("value", ["fail", "skip", "continue"])
+    def test_on_error_values(self, value: str) -> None:
         """Test valid on_error values."""
-        for value in ["fail", "skip", "continue"]:
-            step = StepConfig(component="test", on_error=value)  # type: ignore
-            assert step.on_error == value
-
-    def test_invalid_on_error(self) -> None:
-        """Test invalid on_error raises error."""
-        with pytest.raises(ValidationError):
-            StepConfig(component="test", on_error="invalid")  # type: ignore
+        step = StepConfig(component="test", on_error=value)  # type: ignore
+        assert step.on_error == value
 
 
 class TestFlowDefinition:
@@ -121,7 +150,7 @@ class TestFlowDefinition:
     def test_minimal_definition(self) -> None:
         """Test minimal flow definition."""
         flow = FlowDefinition(
-            steps=[StepConfig(component="test")],
+            steps=[_TEST_STEP],
         )
 
         assert flow.type == "sequential"
@@ -132,7 +161,7 @@ class TestFlowDefinition:
         """Test conditional flow type."""
         flow = FlowDefinition(
             type="conditional",
-            steps=[StepConfig(component="test")],
+            steps=[_TEST_STEP],
         )
 
         assert flow.type == "conditional"
@@ -141,7 +170,7 @@ class TestFlowDefinition:
         """Test custom settings."""
         flow = FlowDefinition(
             settings=FlowSettings(fail_fast=False, timeout_seconds=120),
-            steps=[StepConfig(component="test")],
+            steps=[_TEST_STEP],
         )
 
         assert flow.settings.fail_fast is False
@@ -149,36 +178,28 @@ class TestFlowDefinition:
 
     def test_multiple_steps(self) -> None:
         """Test multiple steps."""
+        # Steps are pre-built without validation: only FlowDefinition is
+        # under test here (model instances are not re-validated)
         flow = FlowDefinition(
             steps=[
-                StepConfig(component="step1"),
-                StepConfig(component="step2"),
-                StepConfig(component="step3"),
+                StepConfig.model_construct(component=f"step{i}")
+                for i in range(1, 4)
             ],
         )
 
-        assert len(flow.steps) == 3
-
-    def test_empty_steps_raises(self) -> None:
-        """Test empty steps raises error."""
-        with pytest.raises(ValidationError):
-            FlowDefinition(steps=[])
+        assert [step.component for step in flow.steps] == [
+            "step1",
+            "step2",
+            "step3",
+        ]
 
 
 class TestFlowConfig:
     """Tests for FlowConfig model."""
 
-    def test_minimal_config(self) -> None:
+    def test_minimal_config(self, minimal_flow_config: FlowConfig) -> None:
         """Test minimal flow configuration."""
-        config = FlowConfig(
-            name="Test Flow",
-            components=[
-                ComponentConfig(name="test", type="myapp.Test"),
-            ],
-            flow=FlowDefinition(
-                steps=[StepConfig(component="test")],
-            ),
-        )
+        config = minimal_flow_config
 
         assert config.name == "Test Flow"
         assert config.version == "1.0"
@@ -192,15 +213,17 @@ class TestFlowConfig:
             version="2.0",
             description="A comprehensive flow",
             components=[
-                ComponentConfig(name="comp1", type="myapp.Comp1"),
-                ComponentConfig(name="comp2", type="myapp.Comp2"),
+                ComponentConfig.model_construct(name="comp1", type="myapp.Comp1"),
+                ComponentConfig.model_construct(name="comp2", type="myapp.Comp2"),
             ],
             flow=FlowDefinition(
                 type="conditional",
                 settings=FlowSettings(fail_fast=False),
                 steps=[
-                    StepConfig(component="comp1"),
-                    StepConfig(component="comp2", condition="context.data.x > 0"),
+                    StepConfig.model_construct(component="comp1"),
+                    StepConfig.model_construct(
+                        component="comp2", condition="context.data.x > 0"
+                    ),
                 ],
             ),
         )
@@ -235,31 +258,19 @@ class TestFlowConfig:
                 ),
             )
 
-    def test_settings_shortcut(self) -> None:
+    def test_settings_shortcut(self, minimal_flow_config: FlowConfig) -> None:
         """Test settings property shortcut."""
-        config = FlowConfig(
-            name="Test",
-            components=[ComponentConfig(name="test", type="myapp.Test")],
-            flow=FlowDefinition(
-                settings=FlowSettings(timeout_seconds=60),
-                steps=[StepConfig(component="test")],
-            ),
-        )
+        config = minimal_flow_config.model_copy(deep=True)
+        config.flow.settings = FlowSettings(timeout_seconds=60)
 
         assert config.settings.timeout_seconds == 60
+        assert minimal_flow_config.settings.timeout_seconds == 300.0
 
-    def test_steps_shortcut(self) -> None:
+    def test_steps_shortcut(self, minimal_flow_config: FlowConfig) -> None:
         """Test steps property shortcut."""
-        config = FlowConfig(
-            name="Test",
-            components=[ComponentConfig(name="test", type="myapp.Test")],
-            flow=FlowDefinition(
-                steps=[
-                    StepConfig(component="test"),
-                ],
-            ),
-        )
+        config = minimal_flow_config
 
+        assert config.steps is config.flow.steps
         assert len(config.steps) == 1
         assert config.steps[0].component == "test"
 
@@ -1,17 +1,24 @@
 """Tests for FlowEngine HTTP component."""
 
+from collections.abc import Iterator
+
 import pytest
 
 from flowengine import FlowContext
 from flowengine.contrib.http import HTTPComponent, HTTPX_AVAILABLE
 
+_VALID_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+
+# One worker under --dist loadgroup (module-scoped fixtures)
+pytestmark = pytest.mark.xdist_group("http")
+
 
 class TestHTTPComponent:
     """Tests for HTTPComponent class."""
 
-    @pytest.fixture
-    def component(self) -> HTTPComponent:
-        """Create an HTTP component instance."""
+    @pytest.fixture(scope="module")
+    def shared_component(self) -> HTTPComponent:
+        """Create an HTTP component instance once per module."""
         comp = HTTPComponent("fetcher")
         comp.init({
             "base_url": "https://api.example.com",
@@ -20,8 +27,16 @@ class TestHTTPComponent:
         return comp
 
     @pytest.fixture
+    def component(self, shared_component: HTTPComponent) -> Iterator[HTTPComponent]:
+        """Yield the shared component, closing any client a test left open."""
+        yield shared_component
+        if shared_component._client is not None:
+            shared_component._client.close()
+            shared_component._client = None
+
+    @pytest.fixture(scope="module")
     def context(self) -> FlowContext:
-        """Create a context for testing."""
+        """Create a context for testing (shared: copy before mutating)."""
         ctx = FlowContext()
         ctx.set("endpoint", "/users/123")
         return ctx
@@ -86,20 +101,18 @@ class TestHTTPComponent:
         errors = comp.validate_config()
         assert any("method" in e.lower() for e in errors)
 
-    def test_validate_all_valid_methods(self) -> None:
+    @pytest.mark.parametrize("method", _VALID_METHODS)
+    def test_validate_all_valid_methods(self, method: str) -> None:
         """Test all valid HTTP methods."""
-        valid_methods = ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
-
-        for method in valid_methods:
-            comp = HTTPComponent("fetcher")
-            comp.init({
-                "base_url": "https://api.example.com",
-                "method": method,
-            })
-            errors = comp.validate_config()
-            # Only check method-related errors
-            method_errors = [e for e in errors if "method" in e.lower()]
-            assert method_errors == [], f"Failed for method: {method}"
+        comp = HTTPComponent("fetcher")
+        comp.init({
+            "base_url": "https://api.example.com",
+            "method": method,
+        })
+        errors = comp.validate_config()
+        # Only check method-related errors
+        method_errors = [e for e in errors if "method" in e.lower()]
+        assert method_errors == []
 
     @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not installed")
     def test_setup_creates_client(
@@ -121,22 +134,18 @@ class TestHTTPComponent:
         component.teardown(context)
         assert component._client is None
 
+    @pytest.mark.skipif(HTTPX_AVAILABLE, reason="httpx is installed")
     def test_validate_httpx_not_installed(self) -> None:
         """Test validation error when httpx not installed."""
-        if HTTPX_AVAILABLE:
-            pytest.skip("httpx is installed")
-
         comp = HTTPComponent("fetcher")
         comp.init({"base_url": "https://api.example.com"})
 
         errors = comp.validate_config()
         assert any("httpx" in e.lower() for e in errors)
 
+    @pytest.mark.skipif(HTTPX_AVAILABLE, reason="httpx is installed")
     def test_process_without_httpx(self, context: FlowContext) -> None:
         """Test process raises error when httpx not installed."""
-        if HTTPX_AVAILABLE:
-            pytest.skip("httpx is installed")
-
         comp = HTTPComponent("fetcher")
         comp.init({"base_url": "https://api.example.com"})
 
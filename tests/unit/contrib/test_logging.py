@@ -7,10 +7,26 @@ import pytest
 from flowengine import FlowContext
 from flowengine.contrib.logging import LoggingComponent
 
+_VALID_LEVELS = ("debug", "info", "warning", "error")
+_USER = {"name": "Alice", "active": True}
+
+# One worker under --dist loadgroup (module-scoped fixtures)
+pytestmark = pytest.mark.xdist_group("logging")
+
+
+def _messages(caplog: pytest.LogCaptureFixture) -> list[str]:
+    """Rendered messages of the captured records."""
+    return [record.getMessage() for record in caplog.records]
+
 
 class TestLoggingComponent:
     """Tests for LoggingComponent class."""
 
+    @pytest.fixture(autouse=True)
+    def _capture_all_levels(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Capture records at every level for all tests in this class."""
+        caplog.set_level(logging.DEBUG)
+
     @pytest.fixture
     def component(self) -> LoggingComponent:
         """Create a logging component instance."""
@@ -18,11 +34,11 @@ class TestLoggingComponent:
         comp.init({})
         return comp
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def context(self) -> FlowContext:
-        """Create a context with test data."""
+        """Create a context with test data (shared: copy before mutating)."""
         ctx = FlowContext()
-        ctx.set("user", {"name": "Alice", "active": True})
+        ctx.set("user", dict(_USER))
         ctx.set("count", 42)
         return ctx
 
@@ -71,13 +87,13 @@ class TestLoggingComponent:
         assert len(errors) == 1
         assert "level" in errors[0].lower()
 
-    def test_validate_all_valid_levels(self) -> None:
+    @pytest.mark.parametrize("level", _VALID_LEVELS)
+    def test_validate_all_valid_levels(self, level: str) -> None:
         """Test all valid log levels."""
-        for level in ["debug", "info", "warning", "error"]:
-            comp = LoggingComponent("logger")
-            comp.init({"level": level})
-            errors = comp.validate_config()
-            assert errors == [], f"Failed for level: {level}"
+        comp = LoggingComponent("logger")
+        comp.init({"level": level})
+        errors = comp.validate_config()
+        assert errors == []
 
     def test_process_returns_context(
         self, component: LoggingComponent, context: FlowContext
@@ -86,17 +102,16 @@ class TestLoggingComponent:
         result = component.process(context)
 
         assert result is context
-        assert result.get("user") == {"name": "Alice", "active": True}
+        assert result.get("user") == _USER
         assert result.get("count") == 42
 
     def test_process_logs_message(
         self, component: LoggingComponent, context: FlowContext, caplog: pytest.LogCaptureFixture
     ) -> None:
         """Test process logs the message."""
-        with caplog.at_level(logging.INFO):
-            component.process(context)
+        component.process(context)
 
-        assert "Context state" in caplog.text
+        assert any("Context state" in m for m in _messages(caplog))
 
     def test_process_logs_data(
         self, context: FlowContext, caplog: pytest.LogCaptureFixture
@@ -105,12 +120,12 @@ class TestLoggingComponent:
         comp = LoggingComponent("logger")
         comp.init({"level": "info", "log_data": True})
 
-        with caplog.at_level(logging.INFO):
-            comp.process(context)
+        comp.process(context)
 
-        assert "Data:" in caplog.text
-        assert "user" in caplog.text
-        assert "count" in caplog.text
+        messages = _messages(caplog)
+        assert any("Data:" in m for m in messages)
+        assert any("user" in m for m in messages)
+        assert any("count" in m for m in messages)
 
     def test_process_logs_specific_keys(
         self, context: FlowContext, caplog: pytest.LogCaptureFixture
@@ -119,27 +134,29 @@ class TestLoggingComponent:
         comp = LoggingComponent("logger")
         comp.init({"level": "info", "keys": ["user"]})
 
-        with caplog.at_level(logging.INFO):
-            comp.process(context)
+        comp.process(context)
 
-        assert "user" in caplog.text
+        messages = _messages(caplog)
+        assert any("user" in m for m in messages)
         # count should not be in output since we only specified "user"
+        assert not any("count" in m for m in messages)
 
     def test_process_logs_metadata(
         self, context: FlowContext, caplog: pytest.LogCaptureFixture
     ) -> None:
         """Test process logs execution metadata."""
+        context = context.copy()  # fresh metadata; shared fixture untouched
         context.metadata.record_timing("comp1", 1.5)
         context.metadata.skipped_components.append("skipped")
 
         comp = LoggingComponent("logger")
         comp.init({"level": "info", "log_metadata": True, "log_data": False})
 
-        with caplog.at_level(logging.INFO):
-            comp.process(context)
+        comp.process(context)
 
-        assert "Metadata:" in caplog.text
-        assert "flow_id" in caplog.text
+        messages = _messages(caplog)
+        assert any("Metadata:" in m for m in messages)
+        assert any("flow_id" in m for m in messages)
 
     def test_process_no_data(
         self, context: FlowContext, caplog: pytest.LogCaptureFixture
@@ -148,22 +165,21 @@ class TestLoggingComponent:
         comp = LoggingComponent("logger")
         comp.init({"level": "info", "log_data": False})
 
-        with caplog.at_level(logging.INFO):
-            comp.process(context)
+        comp.process(context)
 
-        assert "Context state" in caplog.text
-        assert "Data:" not in caplog.text
+        messages = _messages(caplog)
+        assert any("Context state" in m for m in messages)
+        assert not any("Data:" in m for m in messages)
 
+    @pytest.mark.parametrize("level", _VALID_LEVELS)
     def test_different_log_levels(
-        self, context: FlowContext, caplog: pytest.LogCaptureFixture
+        self, level: str, context: FlowContext, caplog: pytest.LogCaptureFixture
     ) -> None:
         """Test logging at different levels."""
-        for level in ["debug", "info", "warning", "error"]:
-            comp = LoggingComponent(f"logger_{level}")
-            comp.init({"level": level, "message": f"Test {level}"})
+        comp = LoggingComponent(f"logger_{level}")
+        comp.init({"level": level, "message": f"Test {level}"})
 
-            with caplog.at_level(getattr(logging, level.upper())):
-                comp.process(context)
+        comp.process(context)
 
-            assert f"Test {level}" in caplog.text
-            caplog.clear()
+        assert any(f"Test {level}" in m for m in _messages(caplog))
+        assert caplog.records[-1].levelname == level.upper()
@@ -28,7 +28,7 @@ class AsyncComponent(BaseComponent):
 
     async def process_async(self, context: FlowContext) -> FlowContext:
         # Simulate async work
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         context.set("async_ran", True)
         return context
 
@@ -43,6 +43,25 @@ class AsyncErrorComponent(BaseComponent):
         raise ValueError("Async failure")
 
 
+# ── Fixtures ─────────────────────────────────────────────────────────────────
+# The components are stateless (all state lives on the context), so one
+# initialized instance of each is shared by every test in the module.
+
+
+@pytest.fixture(scope="module")
+def sync_comp() -> SyncComponent:
+    comp = SyncComponent("sync")
+    comp.init({})
+    return comp
+
+
+@pytest.fixture(scope="module")
+def async_comp() -> AsyncComponent:
+    comp = AsyncComponent("async")
+    comp.init({})
+    return comp
+
+
 # ── Tests ────────────────────────────────────────────────────────────────────
 
 
@@ -51,33 +70,27 @@ class TestIsAsyncProperty:
         comp = SyncComponent("sync")
         assert comp.is_async is False
 
-    def test_async_component_is_async(self):
-        comp = AsyncComponent("async")
-        assert comp.is_async is True
+    def test_async_component_is_async(self, async_comp):
+        assert async_comp.is_async is True
 
-    def test_base_default_is_not_async(self):
+    def test_base_default_is_not_async(self, sync_comp):
         """A component that only implements process() is not async."""
-        comp = SyncComponent("test")
-        comp.init({})
-        assert comp.is_async is False
+        assert sync_comp.is_async is False
 
 
 class TestProcessAsync:
     @pytest.mark.asyncio
-    async def test_sync_fallback_via_process_async(self):
+    async def test_sync_fallback_via_process_async(self, sync_comp):
         """Default process_async calls sync process()."""
-        comp = SyncComponent("sync")
-        comp.init({})
         context = FlowContext()
-        result = await comp.process_async(context)
+        result = await sync_comp.process_async(context)
         assert result.get("sync_ran") is True
 
-    @pytest.mark.asyncio
-    async def test_async_override_runs(self):
-        comp = AsyncComponent("async")
-        comp.init({})
+    # Runs on the module's loop, alongside the module-scoped async_comp
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_override_runs(self, async_comp):
         context = FlowContext()
-        result = await comp.process_async(context)
+        result = await async_comp.process_async(context)
         assert result.get("async_ran") is True
         assert result.get("sync_fallback") is None
 
@@ -91,11 +104,9 @@ class TestProcessAsync:
 
 
 class TestSetOutputPort:
-    def test_set_output_port(self):
-        comp = SyncComponent("test")
-        comp.init({})
+    def test_set_output_port(self, sync_comp):
         context = FlowContext()
-        comp.set_output_port(context, "true")
+        sync_comp.set_output_port(context, "true")
         assert context.get_active_port() == "true"
 
     def test_port_cleared(self):
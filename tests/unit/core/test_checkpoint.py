@@ -29,9 +29,7 @@ from flowengine.errors import FlowExecutionError
 
 class AppendComponent(BaseComponent):
     def process(self, context: FlowContext) -> FlowContext:
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
         return context
 
 
@@ -39,9 +37,7 @@ class SuspendComponent(BaseComponent):
     """Suspends unless resume_data is present."""
 
     def process(self, context: FlowContext) -> FlowContext:
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
 
         if not context.has("resume_data"):
             context.suspend(self.name, reason="Need approval")
@@ -131,7 +127,9 @@ class TestContextSuspension:
 # ── Engine checkpoint integration tests ──────────────────────────────────────
 
 
-def _graph_config():
+@pytest.fixture(scope="class")
+def graph_config() -> FlowConfig:
+    """Graph config built once per test class (the engine never mutates it)."""
     return FlowConfig(
         name="test-checkpoint",
         version="1.0",
@@ -157,16 +155,15 @@ def _graph_config():
 
 
 class TestEngineCheckpoint:
-    def test_creates_checkpoint_on_suspension(self):
+    def test_creates_checkpoint_on_suspension(self, graph_config: FlowConfig):
         store = InMemoryCheckpointStore()
-        config = _graph_config()
         instances = {
             "comp_a": AppendComponent("comp_a"),
             "comp_suspend": SuspendComponent("comp_suspend"),
             "comp_c": AppendComponent("comp_c"),
         }
         engine = FlowEngine(
-            config, instances, validate_types=False, checkpoint_store=store
+            graph_config, instances, validate_types=False, checkpoint_store=store
         )
         result = engine.execute()
 
@@ -175,16 +172,15 @@ class TestEngineCheckpoint:
         assert checkpoint_id is not None
         assert store.load(checkpoint_id) is not None
 
-    def test_resume_completes_flow(self):
+    def test_resume_completes_flow(self, graph_config: FlowConfig):
         store = InMemoryCheckpointStore()
-        config = _graph_config()
         instances = {
             "comp_a": AppendComponent("comp_a"),
             "comp_suspend": SuspendComponent("comp_suspend"),
             "comp_c": AppendComponent("comp_c"),
         }
         engine = FlowEngine(
-            config, instances, validate_types=False, checkpoint_store=store
+            graph_config, instances, validate_types=False, checkpoint_store=store
         )
 
         # First execution: suspends
@@ -199,16 +195,15 @@ class TestEngineCheckpoint:
         # comp_c should have run
         assert "comp_c" in resumed.get("order")
 
-    def test_resume_deletes_checkpoint(self):
+    def test_resume_deletes_checkpoint(self, graph_config: FlowConfig):
         store = InMemoryCheckpointStore()
-        config = _graph_config()
         instances = {
             "comp_a": AppendComponent("comp_a"),
             "comp_suspend": SuspendComponent("comp_suspend"),
             "comp_c": AppendComponent("comp_c"),
         }
         engine = FlowEngine(
-            config, instances, validate_types=False, checkpoint_store=store
+            graph_config, instances, validate_types=False, checkpoint_store=store
         )
 
         result = engine.execute()
@@ -218,27 +213,25 @@ class TestEngineCheckpoint:
         # Checkpoint should be deleted after resume
         assert store.load(checkpoint_id) is None
 
-    def test_resume_invalid_checkpoint_raises(self):
+    def test_resume_invalid_checkpoint_raises(self, graph_config: FlowConfig):
         store = InMemoryCheckpointStore()
-        config = _graph_config()
         instances = {
             "comp_a": AppendComponent("comp_a"),
             "comp_suspend": SuspendComponent("comp_suspend"),
             "comp_c": AppendComponent("comp_c"),
         }
         engine = FlowEngine(
-            config, instances, validate_types=False, checkpoint_store=store
+            graph_config, instances, validate_types=False, checkpoint_store=store
         )
         with pytest.raises(FlowExecutionError, match="Checkpoint not found"):
             engine.resume("nonexistent-id")
 
-    def test_resume_without_store_raises(self):
-        config = _graph_config()
+    def test_resume_without_store_raises(self, graph_config: FlowConfig):
         instances = {
             "comp_a": AppendComponent("comp_a"),
             "comp_suspend": SuspendComponent("comp_suspend"),
             "comp_c": AppendComponent("comp_c"),
         }
-        engine = FlowEngine(config, instances, validate_types=False)
+        engine = FlowEngine(graph_config, instances, validate_types=False)
         with pytest.raises(FlowExecutionError, match="No checkpoint store"):
             engine.resume("some-id")
@@ -1,6 +1,7 @@
 """Tests for FlowEngine context module."""
 
 import json
+import weakref
 
 import pytest
 
@@ -39,6 +40,35 @@ class TestDotDict:
         assert isinstance(d.a, DotDict)
         assert isinstance(d.a.b, DotDict)
 
+    def test_nested_wrapper_reused(self) -> None:
+        """Test nested wrappers are reused until the value is replaced."""
+        d = DotDict({"a": {"b": 1}})
+        wrapper = d.a
+        assert d.a is wrapper
+        assert d.get("a") is wrapper
+
+        d.a = {"b": 2}
+        assert d.a is not wrapper
+        assert d.a.b == 2
+
+    def test_replaced_nested_dict_not_retained(self) -> None:
+        """Test replacing a nested dict drops its cached wrapper."""
+        d = DotDict({"a": {"b": 1}, "c": {"d": 2}})
+        old_a = weakref.ref(d.a)
+        old_c = weakref.ref(d.c)
+
+        d.a = 1
+        d.update({"c": 2})
+
+        assert old_a() is None
+        assert old_c() is None
+
+    def test_empty_nested_dict_writes_through(self) -> None:
+        """Test writes through a wrapped empty dict reach the parent."""
+        d = DotDict({"cfg": {}})
+        d.cfg.x = 1
+        assert d.to_dict() == {"cfg": {"x": 1}}
+
     def test_to_dict(self) -> None:
         """Test conversion to regular dict."""
         d = DotDict({"x": 1, "y": 2})
@@ -54,6 +84,22 @@ class TestDotDict:
         assert d.get("missing", "default") == "default"
         assert d.get("missing") is None
 
+    def test_get_key_named_like_method(self) -> None:
+        """Test get reads data keys that share a name with DotDict methods."""
+        d = DotDict({"items": [1, 2]})
+        assert d.get("items") == [1, 2]
+        assert d.get("keys") is None
+        assert d.get("update", "default") == "default"
+
+    def test_setdefault(self) -> None:
+        """Test setdefault stores the default and returns the stored value."""
+        d = DotDict({"exists": [1]})
+        assert d.setdefault("exists", []) == [1]
+        stored = d.setdefault("missing", [])
+        stored.append(2)
+        assert d.to_dict()["missing"] == [2]
+        assert isinstance(d.setdefault("nested", {"a": 1}), DotDict)
+
     def test_contains(self) -> None:
         """Test 'in' operator."""
         d = DotDict({"key": "value"})
@@ -183,6 +229,51 @@ class TestFlowContext:
         ctx = FlowContext()
         assert ctx.get("missing", "default") == "default"
 
+    def test_setdefault_mutates_in_place(self) -> None:
+        """Test setdefault returns the stored object for in-place updates."""
+        ctx = FlowContext()
+        ctx.setdefault("log", []).append("a")
+        ctx.setdefault("log", []).append("b")
+        assert ctx.get("log") == ["a", "b"]
+
+    def test_setdefault_private_key(self) -> None:
+        """Test setdefault keeps "_" keys out of the data, like set/get."""
+        ctx = FlowContext()
+        ctx.setdefault("_log", []).append(1)
+        ctx.setdefault("_log", []).append(2)
+        assert ctx.get("_log") == [1, 2]
+        assert not ctx.has("_log")
+        assert "_log" not in ctx.to_dict()["data"]
+
+    def test_setdefault_replaces_none(self) -> None:
+        """Test setdefault treats a stored None as missing, like get."""
+        ctx = FlowContext()
+        ctx.set("n", None)
+        assert ctx.setdefault("n", 3) == ctx.get("n", 3) == 3
+        assert ctx.get("n") == 3
+
+    def test_increment(self) -> None:
+        """Test increment starts missing keys at 0 and returns the total."""
+        ctx = FlowContext()
+        assert ctx.increment("count") == 1
+        assert ctx.increment("count", 2) == 3
+        assert ctx.get("count") == 3
+
+    @pytest.mark.parametrize("value", ["1", [1], {"n": 1}, True])
+    def test_increment_non_numeric(self, value: object) -> None:
+        """Test increment rejects a non-numeric stored value by key name."""
+        ctx = FlowContext()
+        ctx.set("count", value)
+        with pytest.raises(TypeError, match="Cannot increment 'count'"):
+            ctx.increment("count")
+        assert ctx.get("count") == value
+
+    def test_weak_reference(self) -> None:
+        """Test context and metadata support weak references."""
+        ctx = FlowContext()
+        assert weakref.ref(ctx)() is ctx
+        assert weakref.ref(ctx.metadata)() is ctx.metadata
+
     def test_has(self) -> None:
         """Test has method."""
         ctx = FlowContext()
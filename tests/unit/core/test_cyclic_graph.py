@@ -6,7 +6,11 @@ metadata tracking, self-loops, and DAG backward compatibility.
 """
 
 import time
-from unittest.mock import MagicMock
+from collections import defaultdict
+from collections.abc import Mapping
+from itertools import pairwise
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
@@ -18,9 +22,30 @@ from flowengine.config.schema import (
     GraphEdgeConfig,
     GraphNodeConfig,
 )
-from flowengine.core.graph import GraphExecutor
+from flowengine.core.graph import GraphExecutor, _detect_cycles
 from flowengine.errors import ComponentError, FlowTimeoutError, MaxIterationsError
 
+# Common flow settings (read-only, shared by many tests)
+_EXIT_AFTER_2 = MappingProxyType(
+    {"timeout_seconds": 60, "max_iterations": 2, "on_max_iterations": "exit"}
+)
+_EXIT_AFTER_3 = MappingProxyType(
+    {"timeout_seconds": 60, "max_iterations": 3, "on_max_iterations": "exit"}
+)
+_EXIT_AFTER_10 = MappingProxyType(
+    {"timeout_seconds": 60, "max_iterations": 10, "on_max_iterations": "exit"}
+)
+_EXIT_AFTER_20 = MappingProxyType(
+    {"timeout_seconds": 60, "max_iterations": 20, "on_max_iterations": "exit"}
+)
+_EXIT_AFTER_100 = MappingProxyType(
+    {"timeout_seconds": 60, "max_iterations": 100, "on_max_iterations": "exit"}
+)
+_FAIL_AFTER_2 = MappingProxyType(
+    {"timeout_seconds": 60, "max_iterations": 2, "on_max_iterations": "fail"}
+)
+
+
 # ── Test components ──────────────────────────────────────────────────────────
 
 
@@ -28,9 +53,7 @@ class AppendComponent(BaseComponent):
     """Appends its name to context.data.order list."""
 
     def process(self, context: FlowContext) -> FlowContext:
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
         return context
 
 
@@ -38,12 +61,8 @@ class CounterComponent(BaseComponent):
     """Increments a counter in context each time it runs."""
 
     def process(self, context: FlowContext) -> FlowContext:
-        key = self.config.get("counter_key", "counter")
-        current = context.get(key, 0)
-        context.set(key, current + 1)
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.increment(self.config.get("counter_key", "counter"))
+        context.setdefault("order", []).append(self.name)
         return context
 
 
@@ -60,9 +79,7 @@ class LoopDeciderComponent(BaseComponent):
         else:
             self.set_output_port(context, "continue")
 
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
         return context
 
 
@@ -72,9 +89,7 @@ class ConditionComponent(BaseComponent):
     def process(self, context: FlowContext) -> FlowContext:
         port = self.config.get("port", "true")
         self.set_output_port(context, port)
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
         return context
 
 
@@ -89,9 +104,7 @@ class SuspendComponent(BaseComponent):
     """Suspends the flow."""
 
     def process(self, context: FlowContext) -> FlowContext:
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
         context.suspend(self.name, reason="Waiting for approval")
         return context
 
@@ -102,9 +115,7 @@ class SlowComponent(BaseComponent):
     def process(self, context: FlowContext) -> FlowContext:
         duration = self.config.get("sleep", 0.1)
         time.sleep(duration)
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
         return context
 
 
@@ -113,13 +124,9 @@ class ConditionalSuspendComponent(BaseComponent):
 
     def process(self, context: FlowContext) -> FlowContext:
         suspend_on = self.config.get("suspend_on_visit", 2)
-        visit_key = f"_visits_{self.name}"
-        visits = context.get(visit_key, 0) + 1
-        context.set(visit_key, visits)
+        visits = context.increment(f"_visits_{self.name}")
 
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
 
         if visits == suspend_on:
             context.suspend(self.name, reason=f"Suspended on visit {visits}")
@@ -132,13 +139,9 @@ class FailOnVisitComponent(BaseComponent):
 
     def process(self, context: FlowContext) -> FlowContext:
         fail_on = self.config.get("fail_on_visit", 2)
-        visit_key = f"_visits_{self.name}"
-        visits = context.get(visit_key, 0) + 1
-        context.set(visit_key, visits)
+        visits = context.increment(f"_visits_{self.name}")
 
-        order = context.get("order", [])
-        order.append(self.name)
-        context.set("order", order)
+        context.setdefault("order", []).append(self.name)
 
         if visits == fail_on:
             raise RuntimeError(f"Intentional failure on visit {visits}")
@@ -146,26 +149,112 @@ class FailOnVisitComponent(BaseComponent):
         return context
 
 
+class RecordingHook:
+    """Records the arguments of each hook event; optionally raises on some."""
+
+    def __init__(self, raise_on: frozenset[str] = frozenset()) -> None:
+        self.calls: dict[str, list[tuple]] = defaultdict(list)
+        self.raise_on = raise_on
+
+    def _record(self, event: str, args: tuple) -> None:
+        self.calls[event].append(args)
+        if event in self.raise_on:
+            raise RuntimeError("Hook exploded")
+
+    def on_node_start(self, *args):
+        self._record("on_node_start", args)
+
+    def on_node_complete(self, *args):
+        self._record("on_node_complete", args)
+
+    def on_iteration_start(self, *args):
+        self._record("on_iteration_start", args)
+
+    def on_iteration_complete(self, *args):
+        self._record("on_iteration_complete", args)
+
+    def on_max_iterations(self, *args):
+        self._record("on_max_iterations", args)
+
+    def on_flow_suspended(self, *args):
+        self._record("on_flow_suspended", args)
+
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
+def _freeze(value: Any) -> Any:
+    """Turn nested mappings/lists into hashable tuples (keys sorted)."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Validated configs by frozen _make_config arguments
+_CONFIG_CACHE: dict[Any, FlowConfig] = {}
+
+
 def _make_config(
     nodes: list[dict],
     edges: list[dict],
     components: list[dict],
-    settings: dict | None = None,
+    settings: Mapping[str, Any] | None = None,
 ) -> FlowConfig:
-    """Build a FlowConfig for graph tests."""
-    return FlowConfig(
-        name="test-cyclic",
-        version="1.0",
-        components=[ComponentConfig(**c) for c in components],
-        flow=FlowDefinition(
-            type="graph",
-            settings=FlowSettings(**(settings or {"timeout_seconds": 60})),
-            nodes=[GraphNodeConfig(**n) for n in nodes],
-            edges=[GraphEdgeConfig(**e) for e in edges],
-        ),
+    """Build a FlowConfig for graph tests.
+
+    Many tests share a graph shape, so each distinct input is validated once
+    and every call returns the same cached config. Treat it as read-only:
+    derive variants with ``_with_settings``, which copies instead of mutating.
+    """
+    key = _freeze((nodes, edges, components, settings))
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        config = _CONFIG_CACHE[key] = FlowConfig(
+            name="test-cyclic",
+            version="1.0",
+            components=[ComponentConfig(**c) for c in components],
+            flow=FlowDefinition(
+                type="graph",
+                settings=FlowSettings(**(settings or {"timeout_seconds": 60})),
+                nodes=[GraphNodeConfig(**n) for n in nodes],
+                edges=[GraphEdgeConfig(**e) for e in edges],
+            ),
+        )
+    return config
+
+
+def _with_settings(config: FlowConfig, **overrides) -> FlowConfig:
+    """Copy a FlowConfig with some flow settings replaced (no revalidation)."""
+    settings = config.flow.settings.model_copy(update=overrides)
+    flow = config.flow.model_copy(update={"settings": settings})
+    return config.model_copy(update={"flow": flow})
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Virtual monotonic clock: time.sleep advances it instead of blocking."""
+    now = [time.monotonic_ns()]
+
+    def sleep(seconds: float) -> None:
+        now[0] += int(seconds * 1e9)
+
+    monkeypatch.setattr(time, "monotonic_ns", lambda: now[0])
+    monkeypatch.setattr(time, "sleep", sleep)
+
+
+@pytest.fixture(scope="module")
+def cycle_ab_config() -> FlowConfig:
+    """A→B→A over components ca/cb, max_iterations=3, exit policy."""
+    return _make_config(
+        nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
+        edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
+        components=[
+            {"name": "ca", "type": "t.A"},
+            {"name": "cb", "type": "t.B"},
+        ],
+        settings=_EXIT_AFTER_3,
     )
 
 
@@ -180,7 +269,7 @@ def _build_executor(
     nodes: list[dict],
     edges: list[dict],
     instances: dict[str, BaseComponent],
-    settings: dict | None = None,
+    settings: Mapping[str, Any] | None = None,
     hooks: list | None = None,
 ) -> GraphExecutor:
     """Build a GraphExecutor directly (bypasses FlowEngine)."""
@@ -196,6 +285,17 @@ def _build_executor(
     )
 
 
+def _build_ab_cycle_executor(config: FlowConfig, hook: Any) -> GraphExecutor:
+    """Build a GraphExecutor for an A→B→A config with the given hook."""
+    return GraphExecutor(
+        nodes=config.flow.nodes,
+        edges=config.flow.edges,
+        components={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
+        settings=config.flow.settings,
+        hooks=[hook],
+    )
+
+
 # ── TestCycleDetection ───────────────────────────────────────────────────────
 
 
@@ -297,6 +397,36 @@ class TestCycleDetection:
         )
         assert "a" in executor._back_edge_targets
 
+    def test_detection_cached_per_shape(self):
+        """Executors for the same graph shape share one cycle analysis."""
+        _detect_cycles.cache_clear()
+        for _ in range(2):
+            executor = _build_executor(
+                nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
+                edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
+                instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
+            )
+        info = _detect_cycles.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert executor._back_edges == {("b", "a")}
+
+    def test_parallel_edges_analyzed_once(self):
+        """Duplicate edges give the same analysis as a single edge."""
+        ids = ("a", "b")
+        single = _detect_cycles(ids, (("a", "b"), ("b", "a")))
+        doubled = _detect_cycles(ids, (("a", "b"), ("a", "b"), ("b", "a"), ("b", "a")))
+        assert doubled == single
+
+    def test_long_chain_beyond_recursion_limit(self):
+        """Detection is iterative, so chain length is not bounded by the stack."""
+        ids = tuple(f"n{i}" for i in range(3000))
+        edges = tuple(pairwise(ids)) + ((ids[-1], ids[0]),)
+        has_cycles, back_edges, targets, cycle_nodes = _detect_cycles(ids, edges)
+        assert has_cycles is True
+        assert back_edges == {(ids[-1], ids[0])}
+        assert targets == {ids[0]}
+        assert cycle_nodes == set(ids)
+
 
 # ── TestSimpleCycle ──────────────────────────────────────────────────────────
 
@@ -304,18 +434,9 @@ class TestCycleDetection:
 class TestSimpleCycle:
     """A→B→A counter with max_iterations and visit counts."""
 
-    def test_simple_cycle_executes(self):
+    def test_simple_cycle_executes(self, cycle_ab_config):
         """A→B→A runs multiple times with exit policy."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-        )
+        config = cycle_ab_config
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -326,18 +447,9 @@ class TestSimpleCycle:
         assert "ca" in order
         assert "cb" in order
 
-    def test_visit_counts_tracked(self):
+    def test_visit_counts_tracked(self, cycle_ab_config):
         """Visit counts are recorded in metadata."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-        )
+        config = cycle_ab_config
         instances = {"ca": CounterComponent("ca"), "cb": CounterComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -347,18 +459,25 @@ class TestSimpleCycle:
         assert result.metadata.node_visit_counts["a"] > 1
         assert result.metadata.node_visit_counts["b"] > 1
 
-    def test_iteration_count_increments(self):
-        """Iteration count increments on back-edge re-entry."""
-        config = _make_config(
+    def test_visit_counts_start_from_a_copy(self):
+        """Counts resumed from metadata are updated without mutating the input."""
+        executor = _build_executor(
             nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
             edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 5,
-                       "on_max_iterations": "exit"},
+            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
+            settings=_EXIT_AFTER_10,
         )
+        context = FlowContext()
+        initial = {"a": 1}
+        context.metadata.node_visit_counts = initial
+        result = executor.execute(context)
+
+        assert initial == {"a": 1}
+        assert result.metadata.node_visit_counts["a"] > 1
+
+    def test_iteration_count_increments(self, cycle_ab_config):
+        """Iteration count increments on back-edge re-entry."""
+        config = _with_settings(cycle_ab_config, max_iterations=5)
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -374,8 +493,7 @@ class TestSimpleCycle:
                 {"name": "ca", "type": "t.A", "config": {"counter_key": "counter"}},
                 {"name": "cb", "type": "t.B", "config": {"counter_key": "counter"}},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {"ca": CounterComponent("ca"), "cb": CounterComponent("cb")}
         engine = _build_engine(config, instances)
@@ -397,8 +515,7 @@ class TestSimpleCycle:
                 {"name": "cb", "type": "t.B"},
             ],
             # Per-node max_visits is high, so iteration limit fires first
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "fail"},
+            settings=_FAIL_AFTER_2,
         )
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
@@ -406,18 +523,9 @@ class TestSimpleCycle:
         with pytest.raises(MaxIterationsError):
             engine.execute()
 
-    def test_cycle_nodes_not_in_completed_nodes(self):
+    def test_cycle_nodes_not_in_completed_nodes(self, cycle_ab_config):
         """Cycle-participating nodes use visit_counts, not completed_nodes."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-        )
+        config = _with_settings(cycle_ab_config, max_iterations=2)
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -444,8 +552,7 @@ class TestSimpleCycle:
                 {"name": "cb", "type": "t.B"},
                 {"name": "cc", "type": "t.C"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -462,18 +569,9 @@ class TestSimpleCycle:
         assert order[1] == "cb"
         assert order[2] == "cc"
 
-    def test_per_node_visit_limit_terminates_queue(self):
+    def test_per_node_visit_limit_terminates_queue(self, cycle_ab_config):
         """Per-node visit limit (from max_iterations default) exhausts queue."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-        )
+        config = _with_settings(cycle_ab_config, max_iterations=2)
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -660,8 +758,7 @@ class TestMaxIterationsPolicy:
                 {"name": "ca", "type": "t.A"},
                 {"name": "cb", "type": "t.B"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "fail"},
+            settings=_FAIL_AFTER_2,
         )
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
@@ -672,18 +769,9 @@ class TestMaxIterationsPolicy:
         assert exc_info.value.max_iterations == 2
         assert exc_info.value.cycle_entry_node == "a"
 
-    def test_exit_policy_stops_silently(self):
+    def test_exit_policy_stops_silently(self, cycle_ab_config):
         """on_max_iterations='exit' stops without raising."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-        )
+        config = _with_settings(cycle_ab_config, max_iterations=2)
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -728,8 +816,7 @@ class TestMaxIterationsPolicy:
                 {"name": "ca", "type": "t.A"},
                 {"name": "cb", "type": "t.B"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 100,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_100,
         )
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
@@ -738,6 +825,22 @@ class TestMaxIterationsPolicy:
         # Node a should only be visited max_visits times
         assert result.metadata.node_visit_counts.get("a", 0) <= 2
 
+    def test_max_visits_change_applies_to_reused_executor(self):
+        """Visit limits are computed per run, not frozen at construction."""
+        executor = _build_executor(
+            nodes=[
+                {"id": "a", "component": "ca", "max_visits": 2},
+                {"id": "b", "component": "cb"},
+            ],
+            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
+            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
+            settings=_EXIT_AFTER_100,
+        )
+        assert executor.execute(FlowContext()).metadata.node_visit_counts["a"] == 2
+
+        executor._nodes["a"].max_visits = 4
+        assert executor.execute(FlowContext()).metadata.node_visit_counts["a"] == 4
+
     def test_fail_policy_error_attributes(self):
         """MaxIterationsError has correct attributes."""
         config = _make_config(
@@ -793,8 +896,7 @@ class TestCycleWithBranches:
                 {"name": "ca", "type": "t.A"},
                 {"name": "cb", "type": "t.B"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {
             "c_entry": AppendComponent("c_entry"),
@@ -833,8 +935,7 @@ class TestCycleWithBranches:
                  "config": {"counter_key": "steps", "threshold": 4}},
                 {"name": "c_finish", "type": "t.F"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 20,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_20,
         )
         instances = {
             "ca": CounterComponent("ca"),
@@ -867,8 +968,7 @@ class TestCycleWithBranches:
                 {"name": "ca", "type": "t.A"},
                 {"name": "cb", "type": "t.B"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_2,
         )
         instances = {
             "c_entry": AppendComponent("c_entry"),
@@ -900,8 +1000,7 @@ class TestCycleWithBranches:
                  "config": {"counter_key": "cnt", "threshold": 3}},
                 {"name": "c_exit", "type": "t.E"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 20,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_20,
         )
         instances = {
             "ca": CounterComponent("ca"),
@@ -937,8 +1036,7 @@ class TestCycleWithBranches:
                 {"name": "c_success", "type": "t.S"},
                 {"name": "c_failure", "type": "t.F"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 20,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_20,
         )
         instances = {
             "c_work": CounterComponent("c_work"),
@@ -976,8 +1074,7 @@ class TestCycleWithBranches:
                 {"name": "c_cleanup", "type": "t.C"},
                 {"name": "c_finish", "type": "t.F"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 20,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_20,
         )
         instances = {
             "ca": CounterComponent("ca"),
@@ -1021,8 +1118,7 @@ class TestMultipleCycles:
                 {"name": "cc", "type": "t.C"},
                 {"name": "cd", "type": "t.D"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1040,31 +1136,6 @@ class TestMultipleCycles:
         assert "cc" in order
         assert "cd" in order
 
-    def test_two_cycles_have_separate_back_edges(self):
-        """Multiple cycles produce multiple back-edges."""
-        executor = _build_executor(
-            nodes=[
-                {"id": "a", "component": "ca"},
-                {"id": "b", "component": "cb"},
-                {"id": "c", "component": "cc"},
-                {"id": "d", "component": "cd"},
-            ],
-            edges=[
-                {"source": "a", "target": "b"},
-                {"source": "b", "target": "a"},
-                {"source": "c", "target": "d"},
-                {"source": "d", "target": "c"},
-            ],
-            instances={
-                "ca": AppendComponent("ca"),
-                "cb": AppendComponent("cb"),
-                "cc": AppendComponent("cc"),
-                "cd": AppendComponent("cd"),
-            },
-        )
-        assert executor._has_cycles is True
-        assert len(executor._back_edges) == 2
-
     def test_sequential_cycles(self):
         """Two cycles connected: A→B→A with A also pointing to C→D→C."""
         config = _make_config(
@@ -1087,8 +1158,7 @@ class TestMultipleCycles:
                 {"name": "cc", "type": "t.C"},
                 {"name": "cd", "type": "t.D"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1103,29 +1173,28 @@ class TestMultipleCycles:
         order = result.get("order")
         assert len(order) > 0
 
-    def test_multiple_back_edge_targets(self):
-        """Both cycle entry points are tracked as back-edge targets."""
+    @pytest.mark.parametrize(
+        "edges",
+        [
+            pytest.param(
+                [("a", "b"), ("b", "a"), ("c", "d"), ("d", "c")],
+                id="independent",
+            ),
+            pytest.param(
+                [("a", "b"), ("b", "c"), ("c", "a"), ("b", "d"), ("d", "b")],
+                id="nested",
+            ),
+        ],
+    )
+    def test_each_cycle_has_its_own_back_edge(self, edges):
+        """Every cycle contributes a back-edge and a back-edge target."""
         executor = _build_executor(
-            nodes=[
-                {"id": "a", "component": "ca"},
-                {"id": "b", "component": "cb"},
-                {"id": "c", "component": "cc"},
-                {"id": "d", "component": "cd"},
-            ],
-            edges=[
-                {"source": "a", "target": "b"},
-                {"source": "b", "target": "a"},
-                {"source": "c", "target": "d"},
-                {"source": "d", "target": "c"},
-            ],
-            instances={
-                "ca": AppendComponent("ca"),
-                "cb": AppendComponent("cb"),
-                "cc": AppendComponent("cc"),
-                "cd": AppendComponent("cd"),
-            },
+            nodes=[{"id": n, "component": f"c{n}"} for n in "abcd"],
+            edges=[{"source": src, "target": dst} for src, dst in edges],
+            instances={f"c{n}": AppendComponent(f"c{n}") for n in "abcd"},
         )
-        # Both cycle targets should be in back_edge_targets
+        assert executor._has_cycles is True
+        assert len(executor._back_edges) == 2
         assert len(executor._back_edge_targets) == 2
 
 
@@ -1157,8 +1226,7 @@ class TestNestedCycles:
                 {"name": "cc", "type": "t.C"},
                 {"name": "cd", "type": "t.D"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1174,32 +1242,6 @@ class TestNestedCycles:
         assert len(order) > 0
         assert "ca" in order
 
-    def test_nested_cycle_has_multiple_back_edges(self):
-        """Nested cycles produce multiple back-edges."""
-        executor = _build_executor(
-            nodes=[
-                {"id": "a", "component": "ca"},
-                {"id": "b", "component": "cb"},
-                {"id": "c", "component": "cc"},
-                {"id": "d", "component": "cd"},
-            ],
-            edges=[
-                {"source": "a", "target": "b"},
-                {"source": "b", "target": "c"},
-                {"source": "c", "target": "a"},
-                {"source": "b", "target": "d"},
-                {"source": "d", "target": "b"},
-            ],
-            instances={
-                "ca": AppendComponent("ca"),
-                "cb": AppendComponent("cb"),
-                "cc": AppendComponent("cc"),
-                "cd": AppendComponent("cd"),
-            },
-        )
-        assert executor._has_cycles is True
-        assert len(executor._back_edges) >= 2
-
     def test_nested_cycle_terminates(self):
         """Nested cycles terminate within iteration/visit limits."""
         config = _make_config(
@@ -1222,8 +1264,7 @@ class TestNestedCycles:
                 {"name": "cc", "type": "t.C"},
                 {"name": "cd", "type": "t.D"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_2,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1245,6 +1286,7 @@ class TestNestedCycles:
 class TestCyclicTimeout:
     """Global timeout across iterations."""
 
+    @pytest.mark.usefixtures("fake_clock")
     def test_timeout_during_cycle(self):
         """Flow timeout triggers during cyclic execution."""
         config = _make_config(
@@ -1266,6 +1308,7 @@ class TestCyclicTimeout:
         with pytest.raises(FlowTimeoutError):
             engine.execute()
 
+    @pytest.mark.usefixtures("fake_clock")
     def test_timeout_has_elapsed_info(self):
         """Timeout exception carries elapsed time."""
         config = _make_config(
@@ -1287,20 +1330,12 @@ class TestCyclicTimeout:
         with pytest.raises(FlowTimeoutError) as exc_info:
             engine.execute()
 
-        assert exc_info.value.elapsed > 0
+        # a and b each "sleep" 0.3s; the check before the third visit fires
+        assert exc_info.value.elapsed == pytest.approx(0.6)
 
-    def test_fast_cycle_completes_within_timeout(self):
+    def test_fast_cycle_completes_within_timeout(self, cycle_ab_config):
         """Fast cycle completes within timeout."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-        )
+        config = cycle_ab_config
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -1331,8 +1366,7 @@ class TestCyclicSuspension:
                 {"name": "ca", "type": "t.A"},
                 {"name": "cs", "type": "t.S"},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 10,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_10,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1360,8 +1394,7 @@ class TestCyclicSuspension:
                 {"name": "cs", "type": "t.S",
                  "config": {"suspend_on_visit": 2}},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 10,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_10,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1438,8 +1471,7 @@ class TestCyclicSuspension:
                 {"name": "cs", "type": "t.S",
                  "config": {"suspend_on_visit": 2}},
             ],
-            settings={"timeout_seconds": 60, "max_iterations": 10,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_10,
         )
         instances = {
             "ca": AppendComponent("ca"),
@@ -1459,71 +1491,72 @@ class TestCyclicSuspension:
 class TestCyclicHooks:
     """Hook events fire for iterations."""
 
-    def test_on_iteration_start_fires(self):
+    def test_on_iteration_start_fires(self, cycle_ab_config):
         """on_iteration_start hook fires when iteration begins."""
-        hook = MagicMock()
-        executor = _build_executor(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-            hooks=[hook],
-        )
+        hook = RecordingHook()
+        executor = _build_ab_cycle_executor(cycle_ab_config, hook)
         context = FlowContext()
         executor.execute(context)
 
         # on_iteration_start should have been called
-        assert hook.on_iteration_start.called
+        assert hook.calls["on_iteration_start"]
 
-    def test_on_iteration_complete_fires(self):
+    def test_on_iteration_complete_fires(self, cycle_ab_config):
         """on_iteration_complete hook fires when an iteration finishes."""
-        hook = MagicMock()
-        executor = _build_executor(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-            hooks=[hook],
-        )
+        hook = RecordingHook()
+        executor = _build_ab_cycle_executor(cycle_ab_config, hook)
         context = FlowContext()
         executor.execute(context)
 
         # on_iteration_complete should have been called
-        assert hook.on_iteration_complete.called
+        assert hook.calls["on_iteration_complete"]
         # Each call should include iteration number, node_id, context, duration
-        for call in hook.on_iteration_complete.call_args_list:
-            args = call[0]
+        for args in hook.calls["on_iteration_complete"]:
             assert isinstance(args[0], int)   # iteration
             assert isinstance(args[1], str)   # cycle_entry_node
             assert isinstance(args[3], float)  # duration >= 0
 
-    def test_on_iteration_complete_covers_all_iterations(self):
+    def test_on_iteration_complete_covers_all_iterations(self, cycle_ab_config):
         """on_iteration_complete fires for every iteration including the final one.
 
         on_iteration_start fires N times (at back-edge re-entry).
         on_iteration_complete fires N+1 times (N at re-entry for the *previous*
         iteration + 1 for the final iteration when the queue empties).
         """
-        hook = MagicMock()
+        hook = RecordingHook()
+        executor = _build_ab_cycle_executor(cycle_ab_config, hook)
+        context = FlowContext()
+        executor.execute(context)
+
+        # complete fires one more than start (final iteration end)
+        calls = hook.calls
+        assert len(calls["on_iteration_complete"]) == len(calls["on_iteration_start"]) + 1
+
+    def test_hooks_appended_after_run_are_notified(self):
+        """Hooks may implement a subset of events and join between runs."""
+
+        class StartOnlyHook:
+            def on_node_start(self, node_id, component, context):
+                context.setdefault("started", []).append(component)
+
+        hooks: list[Any] = [RecordingHook()]
         executor = _build_executor(
             nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
             edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
             instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-            hooks=[hook],
+            settings=_EXIT_AFTER_3,
+            hooks=hooks,
         )
-        context = FlowContext()
-        executor.execute(context)
+        executor.execute(FlowContext())
+        hooks.append(StartOnlyHook())
 
-        # complete fires one more than start (final iteration end)
-        assert hook.on_iteration_complete.call_count == hook.on_iteration_start.call_count + 1
+        result = executor.execute(FlowContext())
+
+        assert result.get("started") == result.get("order")
 
     def test_on_max_iterations_hook_fires(self):
         """on_max_iterations hook fires when iteration limit is reached."""
-        hook = MagicMock()
+        hook = RecordingHook()
         executor = _build_executor(
             nodes=[
                 {"id": "a", "component": "ca", "max_visits": 100},
@@ -1531,21 +1564,20 @@ class TestCyclicHooks:
             ],
             edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
             instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_2,
             hooks=[hook],
         )
         context = FlowContext()
         executor.execute(context)
 
-        assert hook.on_max_iterations.called
-        args = hook.on_max_iterations.call_args[0]
+        assert hook.calls["on_max_iterations"]
+        args = hook.calls["on_max_iterations"][-1]
         assert args[0] == 2  # max_iterations value
         assert isinstance(args[1], str)  # cycle_entry_node
 
     def test_on_max_iterations_hook_fires_before_exception(self):
         """on_max_iterations hook fires even when policy is 'fail'."""
-        hook = MagicMock()
+        hook = RecordingHook()
         executor = _build_executor(
             nodes=[
                 {"id": "a", "component": "ca", "max_visits": 100},
@@ -1553,8 +1585,7 @@ class TestCyclicHooks:
             ],
             edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
             instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "fail"},
+            settings=_FAIL_AFTER_2,
             hooks=[hook],
         )
         context = FlowContext()
@@ -1562,44 +1593,34 @@ class TestCyclicHooks:
             executor.execute(context)
 
         # Hook should still have fired before the exception
-        assert hook.on_max_iterations.called
+        assert hook.calls["on_max_iterations"]
 
-    def test_on_node_start_fires_each_visit(self):
+    def test_on_node_start_fires_each_visit(self, cycle_ab_config):
         """on_node_start fires for every node visit in cycle."""
-        hook = MagicMock()
-        executor = _build_executor(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-            hooks=[hook],
+        hook = RecordingHook()
+        executor = _build_ab_cycle_executor(
+            _with_settings(cycle_ab_config, max_iterations=2), hook
         )
         context = FlowContext()
         executor.execute(context)
 
         # on_node_start should fire for each visit
-        assert hook.on_node_start.call_count >= 4  # At least 2 iterations x 2 nodes
+        assert len(hook.calls["on_node_start"]) >= 4  # At least 2 iterations x 2 nodes
 
-    def test_on_node_complete_fires_each_visit(self):
+    def test_on_node_complete_fires_each_visit(self, cycle_ab_config):
         """on_node_complete fires for every node visit in cycle."""
-        hook = MagicMock()
-        executor = _build_executor(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-            hooks=[hook],
+        hook = RecordingHook()
+        executor = _build_ab_cycle_executor(
+            _with_settings(cycle_ab_config, max_iterations=2), hook
         )
         context = FlowContext()
         executor.execute(context)
 
-        assert hook.on_node_complete.call_count >= 4
+        assert len(hook.calls["on_node_complete"]) >= 4
 
     def test_on_flow_suspended_fires_in_cycle(self):
         """on_flow_suspended hook fires when cycle suspends."""
-        hook = MagicMock()
+        hook = RecordingHook()
         executor = _build_executor(
             nodes=[
                 {"id": "a", "component": "ca"},
@@ -1613,31 +1634,26 @@ class TestCyclicHooks:
                 "ca": AppendComponent("ca"),
                 "cs": SuspendComponent("cs"),
             },
-            settings={"timeout_seconds": 60, "max_iterations": 10,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_10,
             hooks=[hook],
         )
         context = FlowContext()
         executor.execute(context)
 
-        assert hook.on_flow_suspended.called
+        assert hook.calls["on_flow_suspended"]
 
-    def test_hook_error_does_not_break_execution(self):
+    def test_hook_error_does_not_break_execution(self, cycle_ab_config):
         """Hook exceptions are silently caught."""
-        hook = MagicMock()
-        hook.on_node_start.side_effect = RuntimeError("Hook exploded")
-        hook.on_node_complete.side_effect = RuntimeError("Hook exploded")
-        hook.on_iteration_start.side_effect = RuntimeError("Hook exploded")
-        hook.on_iteration_complete.side_effect = RuntimeError("Hook exploded")
-        hook.on_max_iterations.side_effect = RuntimeError("Hook exploded")
+        hook = RecordingHook(raise_on=frozenset({
+            "on_node_start",
+            "on_node_complete",
+            "on_iteration_start",
+            "on_iteration_complete",
+            "on_max_iterations",
+        }))
 
-        executor = _build_executor(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            instances={"ca": AppendComponent("ca"), "cb": AppendComponent("cb")},
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-            hooks=[hook],
+        executor = _build_ab_cycle_executor(
+            _with_settings(cycle_ab_config, max_iterations=2), hook
         )
         context = FlowContext()
         # Should not raise despite hook errors
@@ -1679,6 +1695,25 @@ class TestCyclicErrorHandling:
         with pytest.raises(ComponentError):
             engine.execute()
 
+    def test_settings_changes_apply_to_reused_executor(self):
+        """Settings are read per run, so a reused executor sees updates."""
+        executor = _build_executor(
+            nodes=[
+                {"id": "a", "component": "ca", "on_error": "continue"},
+                {"id": "b", "component": "cb"},
+            ],
+            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
+            instances={"ca": FailComponent("ca"), "cb": AppendComponent("cb")},
+            settings={**_EXIT_AFTER_2, "fail_fast": True},
+        )
+        with pytest.raises(ComponentError):
+            executor.execute(FlowContext())
+
+        executor._settings.fail_fast = False
+        result = executor.execute(FlowContext())
+
+        assert "cb" in result.get("order")
+
     def test_on_error_skip_in_cycle(self):
         """on_error='skip' records error and continues cycle."""
         config = _make_config(
@@ -1801,18 +1836,9 @@ class TestCyclicErrorHandling:
 class TestCyclicMetadata:
     """Visit counts, iteration counts, and timings."""
 
-    def test_visit_counts_accurate(self):
+    def test_visit_counts_accurate(self, cycle_ab_config):
         """Visit counts match actual executions."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-        )
+        config = cycle_ab_config
         instances = {"ca": CounterComponent("ca"), "cb": CounterComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -1825,18 +1851,9 @@ class TestCyclicMetadata:
         assert result.metadata.node_visit_counts["a"] == ca_count
         assert result.metadata.node_visit_counts["b"] == cb_count
 
-    def test_component_timings_aggregated(self):
+    def test_component_timings_aggregated(self, cycle_ab_config):
         """Component timings aggregate across visits."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-        )
+        config = cycle_ab_config
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -1847,18 +1864,9 @@ class TestCyclicMetadata:
         assert timings["ca"] >= 0
         assert timings["cb"] >= 0
 
-    def test_metadata_serialization_round_trip(self):
+    def test_metadata_serialization_round_trip(self, cycle_ab_config):
         """Cyclic metadata survives to_dict/from_dict round trip."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
-        )
+        config = cycle_ab_config
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -1871,18 +1879,9 @@ class TestCyclicMetadata:
         assert restored.metadata.iteration_count == result.metadata.iteration_count
         assert restored.metadata.max_iterations_reached == result.metadata.max_iterations_reached
 
-    def test_step_timings_have_correct_execution_order(self):
+    def test_step_timings_have_correct_execution_order(self, cycle_ab_config):
         """Step timings track execution order across iterations."""
-        config = _make_config(
-            nodes=[{"id": "a", "component": "ca"}, {"id": "b", "component": "cb"}],
-            edges=[{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
-            components=[
-                {"name": "ca", "type": "t.A"},
-                {"name": "cb", "type": "t.B"},
-            ],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
-        )
+        config = _with_settings(cycle_ab_config, max_iterations=2)
         instances = {"ca": AppendComponent("ca"), "cb": AppendComponent("cb")}
         engine = _build_engine(config, instances)
         result = engine.execute()
@@ -1906,8 +1905,7 @@ class TestSelfLoop:
             nodes=[{"id": "a", "component": "ca"}],
             edges=[{"source": "a", "target": "a"}],
             components=[{"name": "ca", "type": "t.A"}],
-            settings={"timeout_seconds": 60, "max_iterations": 3,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_3,
         )
         instances = {"ca": CounterComponent("ca")}
         engine = _build_engine(config, instances)
@@ -1922,8 +1920,7 @@ class TestSelfLoop:
             nodes=[{"id": "a", "component": "ca"}],
             edges=[{"source": "a", "target": "a"}],
             components=[{"name": "ca", "type": "t.A"}],
-            settings={"timeout_seconds": 60, "max_iterations": 2,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_2,
         )
         instances = {"ca": CounterComponent("ca")}
         engine = _build_engine(config, instances)
@@ -1938,8 +1935,7 @@ class TestSelfLoop:
             nodes=[{"id": "a", "component": "ca", "max_visits": 5}],
             edges=[{"source": "a", "target": "a"}],
             components=[{"name": "ca", "type": "t.A"}],
-            settings={"timeout_seconds": 60, "max_iterations": 100,
-                       "on_max_iterations": "exit"},
+            settings=_EXIT_AFTER_100,
         )
         instances = {"ca": CounterComponent("ca")}
         engine = _build_engine(config, instances)
@@ -149,6 +149,16 @@ class TestFlowEngine:
         assert result.get("count") == 3
         assert len(result.metadata.component_timings) == 3
 
+    def test_execute_uses_replaced_component(self, simple_config: FlowConfig) -> None:
+        """Test components replaced after construction are used on execute."""
+        engine = FlowEngine(simple_config, {"inc": IncrementComponent("inc")})
+        engine.components["inc"] = SetupTeardownComponent("inc")
+
+        result = engine.execute()
+
+        assert result.get("inc_process") is True
+        assert result.get("count") is None
+
     def test_execute_with_input_data(self, simple_config: FlowConfig) -> None:
         """Test execution with input data."""
         components = {"inc": IncrementComponent("inc")}
@@ -283,6 +293,18 @@ class TestFlowEngine:
         assert result.get("comp_process") is True
         assert result.get("comp_teardown") is True
 
+    def test_instance_setup_teardown_called(self, simple_config: FlowConfig) -> None:
+        """Test setup/teardown attached to an instance are called."""
+        component = IncrementComponent("inc")
+        calls: list[str] = []
+        component.setup = lambda context: calls.append("setup")  # type: ignore[method-assign]
+        component.teardown = lambda context: calls.append("teardown")  # type: ignore[method-assign]
+        engine = FlowEngine(simple_config, {"inc": component})
+
+        engine.execute()
+
+        assert calls == ["setup", "teardown"]
+
     def test_teardown_called_on_error(self) -> None:
         """Test teardown is called even when process fails."""
 
@@ -393,3 +415,19 @@ class TestFlowEngine:
 
         assert "inc" in result.metadata.component_timings
         assert result.metadata.component_timings["inc"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_execute_async_steps(self, multi_step_config: FlowConfig) -> None:
+        """Test step flows run to completion through execute_async."""
+        components = {
+            "inc1": IncrementComponent("inc1"),
+            "inc2": IncrementComponent("inc2"),
+            "inc3": IncrementComponent("inc3"),
+        }
+        engine = FlowEngine(multi_step_config, components)
+
+        result = await engine.execute_async(input_data={"initial": "data"})
+
+        assert result.get("count") == 3
+        assert result.input == {"initial": "data"}
+        assert result.metadata.completed_at is not None
@@ -8,7 +8,7 @@ from flowengine import (
     FlowContext,
     FlowEngine,
 )
-from flowengine.core.graph import GraphExecutor
+from flowengine.core.graph import GraphExecutor, _topological_order
 from flowengine.config.schema import (
     ComponentConfig,
     FlowDefinition,
@@ -138,6 +138,20 @@ class TestGraphLinear:
 
         assert result.get("order") == ["comp_only"]
 
+    def test_reused_executor_sees_component_changes(self):
+        components: dict[str, BaseComponent] = {}
+        executor = GraphExecutor(
+            [GraphNodeConfig(id="only", component="comp_only")],
+            [],
+            components,
+            FlowSettings(),
+        )
+        components["comp_only"] = AppendComponent("comp_only")
+
+        result = executor.execute(FlowContext())
+
+        assert result.get("order") == ["comp_only"]
+
 
 class TestGraphBranching:
     """Branching with port-based routing."""
@@ -235,6 +249,62 @@ class TestGraphDiamond:
         assert "comp_c" in order
 
 
+class TestGraphChainOrder:
+    """Independent chains: A → B, C → D"""
+
+    def test_ready_nodes_run_in_fifo_order(self):
+        config = _make_config(
+            nodes=[
+                {"id": "a", "component": "comp_a"},
+                {"id": "c", "component": "comp_c"},
+                {"id": "b", "component": "comp_b"},
+                {"id": "d", "component": "comp_d"},
+            ],
+            edges=[
+                {"source": "a", "target": "b"},
+                {"source": "c", "target": "d"},
+            ],
+            components=[
+                {"name": "comp_a", "type": "t.A"},
+                {"name": "comp_b", "type": "t.B"},
+                {"name": "comp_c", "type": "t.C"},
+                {"name": "comp_d", "type": "t.D"},
+            ],
+        )
+        instances = {
+            name: AppendComponent(name)
+            for name in ("comp_a", "comp_b", "comp_c", "comp_d")
+        }
+        engine = _build_engine(config, instances)
+        result = engine.execute()
+
+        assert result.get("order") == ["comp_a", "comp_c", "comp_b", "comp_d"]
+        assert engine.dry_run() == result.get("order")
+
+    def test_order_computed_once_per_shape(self):
+        config = _make_config(
+            nodes=[
+                {"id": "a", "component": "comp_a"},
+                {"id": "b", "component": "comp_b"},
+            ],
+            edges=[{"source": "a", "target": "b"}],
+            components=[
+                {"name": "comp_a", "type": "t.A"},
+                {"name": "comp_b", "type": "t.B"},
+            ],
+        )
+        instances = {name: AppendComponent(name) for name in ("comp_a", "comp_b")}
+        engine = _build_engine(config, instances)
+
+        _topological_order.cache_clear()
+        engine.execute()
+        result = engine.execute()
+
+        assert result.get("order") == ["comp_a", "comp_b"]
+        info = _topological_order.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
 class TestGraphMultipleRoots:
     """Multiple roots (parallel entry points)."""
 
@@ -298,6 +368,23 @@ class TestGraphDefaultEdges:
 
         assert result.get("order") == ["comp_a", "comp_b"]
 
+    @pytest.mark.parametrize(
+        "port, expected",
+        [("hit", ["x", "y", "z"]), ("other", ["y"]), (None, ["y"])],
+    )
+    def test_mixed_edges_keep_declaration_order(self, port, expected):
+        nodes = [
+            GraphNodeConfig(id=nid, component=nid) for nid in ("a", "x", "y", "z")
+        ]
+        edges = [
+            GraphEdgeConfig(source="a", target="x", port="hit"),
+            GraphEdgeConfig(source="a", target="y"),
+            GraphEdgeConfig(source="a", target="z", port="hit"),
+        ]
+        executor = GraphExecutor(nodes, edges, {}, FlowSettings())
+
+        assert executor._get_reachable_targets("a", port) == expected
+
 
 class TestGraphValidation:
     """Schema and cycle validation."""
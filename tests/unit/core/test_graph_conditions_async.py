@@ -2,7 +2,7 @@
 
 import pytest
 
-from flowengine import BaseComponent, FlowContext
+from flowengine import BaseComponent, ConfigLoader, FlowContext, FlowEngine
 from flowengine.config.schema import (
     FlowSettings,
     GraphEdgeConfig,
@@ -171,3 +171,25 @@ async def test_execute_async_cyclic_with_max_iterations():
     out = await ex.execute_async(FlowContext())
     assert out.get("n") >= 1
     assert out.metadata.iteration_count <= 4
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_async_graph_flow():
+    # FlowEngine.execute_async routes graph flows to the async executor.
+    config = ConfigLoader.from_dict({
+        "name": "Async Graph",
+        "components": [
+            {"name": "s", "type": "test.AsyncMark"},
+            {"name": "a", "type": "test.AsyncMark"},
+        ],
+        "flow": {
+            "type": "graph",
+            "nodes": [{"id": "s", "component": "s"},
+                      {"id": "a", "component": "a"}],
+            "edges": [{"source": "s", "target": "a"}],
+        },
+    })
+    engine = FlowEngine(config, {"s": AsyncMark("s"), "a": AsyncMark("a")})
+    out = await engine.execute_async()
+    assert out.get("order") == ["s", "a"]
+    assert out.metadata.completed_at is not None
@@ -1,6 +1,10 @@
 """Tests for FlowEngine improvements."""
 
+import importlib
+import sys
 import time
+from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 
@@ -19,6 +23,18 @@ from flowengine import (
 
 # === Test Components ===
 
+# Source for a module that TestComponentRegistry rewrites and reloads
+_RELOADABLE_SOURCE = """\
+from flowengine import BaseComponent
+
+
+class Reloadable(BaseComponent):
+    VALUE = {value}
+
+    def process(self, context):
+        return context
+"""
+
 
 class SlowComponent(BaseComponent):
     """Component that sleeps for a configured duration."""
@@ -447,6 +463,45 @@ class TestComponentRegistry:
         with pytest.raises(ConfigurationError, match="Module not found"):
             load_component_class("nonexistent.module.Component")
 
+    def test_load_component_class_cached(self) -> None:
+        """Test repeated loads of a type path reuse the resolved class."""
+        from flowengine.contrib.logging import LoggingComponent
+
+        path = "flowengine.contrib.logging.LoggingComponent"
+        load_component_class.cache_clear()
+        assert load_component_class(path) is LoggingComponent
+        assert load_component_class(path) is LoggingComponent
+        assert load_component_class.cache_info().hits == 1
+
+    @pytest.fixture
+    def reloadable_module(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[Path]:
+        """A throwaway component module; cache and import are undone after."""
+        source = tmp_path / "reloadable_comp.py"
+        source.write_text(_RELOADABLE_SOURCE.format(value=1))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        # A same-second rewrite keeps mtime and size, so a .pyc would be stale
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+        yield source
+        # Don't leave a reloaded class cached for later tests
+        load_component_class.cache_clear()
+        sys.modules.pop("reloadable_comp", None)
+
+    def test_load_component_class_after_reload(self, reloadable_module: Path) -> None:
+        """Test a reloaded module's class is returned only after cache_clear."""
+        path = "reloadable_comp.Reloadable"
+        first = load_component_class(path)
+        assert first.VALUE == 1
+
+        reloadable_module.write_text(_RELOADABLE_SOURCE.format(value=2))
+        importlib.invalidate_caches()
+        importlib.reload(sys.modules["reloadable_comp"])
+        assert load_component_class(path) is first
+
+        load_component_class.cache_clear()
+        assert load_component_class(path).VALUE == 2
+
 
 class TestEngineValidateComponentTypes:
     """Test engine component type validation."""
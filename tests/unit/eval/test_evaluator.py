@@ -1,8 +1,12 @@
 """Tests for FlowEngine condition evaluator."""
 
+import ast
+
 import pytest
 
 from flowengine import ConditionEvaluationError, ConditionEvaluator, FlowContext
+from flowengine.eval.evaluator import _compile_condition
+from flowengine.eval.safe_ast import SafeASTValidator
 
 
 class TestConditionEvaluator:
@@ -164,6 +168,51 @@ class TestConditionEvaluator:
         with pytest.raises(ConditionEvaluationError, match="[Rr]untime"):
             evaluator.evaluate("undefined_var > 5", context)
 
+    # === Compilation cache ===
+
+    def test_compiled_condition_reused(
+        self, evaluator: ConditionEvaluator, context: FlowContext
+    ) -> None:
+        """Test a condition is compiled once and reused on later evaluations."""
+        code = evaluator.compile_condition("context.data.count > 5")
+        assert evaluator.compile_condition("context.data.count > 5") is code
+        assert evaluator.evaluate("context.data.count > 5", context) is True
+
+    def test_compile_cache_bounded(self, evaluator: ConditionEvaluator) -> None:
+        """Test the compile cache keeps a bounded number of conditions."""
+        _compile_condition.cache_clear()
+        for i in range(300):
+            evaluator.compile_condition(f"context.data.count > {i}")
+        assert _compile_condition.cache_info().currsize == 256
+
+    def test_compile_cache_shared_across_evaluators(self) -> None:
+        """Test evaluators with the default validator share compiled code."""
+        code = ConditionEvaluator().compile_condition("context.data.n > 1")
+        assert ConditionEvaluator().compile_condition("context.data.n > 1") is code
+
+    def test_replaced_validator_bypasses_cache(
+        self, evaluator: ConditionEvaluator
+    ) -> None:
+        """Test a replaced validator is applied even to cached conditions."""
+
+        class RejectAll(SafeASTValidator):
+            def validate(self, node: ast.AST) -> bool:
+                self.errors = ["rejected"]
+                return False
+
+        evaluator.compile_condition("context.data.n > 2")
+        evaluator.validator = RejectAll()
+        with pytest.raises(ConditionEvaluationError, match="rejected"):
+            evaluator.compile_condition("context.data.n > 2")
+
+    def test_unsafe_condition_not_cached(
+        self, evaluator: ConditionEvaluator, context: FlowContext
+    ) -> None:
+        """Test rejected conditions keep raising on every evaluation."""
+        for _ in range(2):
+            with pytest.raises(ConditionEvaluationError, match="Unsafe"):
+                evaluator.evaluate("len(context.data.numbers) > 0", context)
+
     # === is_safe method ===
 
     def test_is_safe_valid(self, evaluator: ConditionEvaluator) -> None: